@@ -21,6 +21,7 @@ from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
@@ -367,6 +368,51 @@ DAEMON_LOG_FILE = os.path.join(_VENV_TEMP_DIR, "omnipkg_daemon.log")
 # next client invocation relaunches it with the freshly-installed code.
 DAEMON_VERSION_STAMP_FILE = os.path.join(_VENV_TEMP_DIR, "omnipkg_daemon_version.txt")
 
+# Optional CPU pinning (OMNIPKG_PIN_WORKERS=1, Linux only). The daemon's
+# dispatcher threads keep the first _DISPATCH_CORES allowed cores; workers
+# are spread round-robin over the rest so each keeps its cache-warm core
+# instead of migrating under load.
+_PIN_WORKERS = os.environ.get("OMNIPKG_PIN_WORKERS") == "1" and hasattr(os, "sched_setaffinity")
+_DISPATCH_CORES = 2
+_pin_lock = threading.Lock()
+_pin_next = 0
+
+
+def _core_split():
+    """(dispatcher cores, worker cores) from the allowed set at import time."""
+    cores = sorted(os.sched_getaffinity(0))
+    if len(cores) <= _DISPATCH_CORES:
+        return cores, cores
+    return cores[:_DISPATCH_CORES], cores[_DISPATCH_CORES:]
+
+
+# Taken once: after _pin_dispatcher() narrows this process's own mask,
+# sched_getaffinity(0) no longer reports the worker cores.
+_CORE_SPLIT = _core_split() if _PIN_WORKERS else None
+
+
+def _pin_dispatcher():
+    if not _PIN_WORKERS:
+        return
+    try:
+        os.sched_setaffinity(0, _CORE_SPLIT[0])
+    except OSError:
+        pass
+
+
+def _pin_worker(pid: int):
+    global _pin_next
+    if not _PIN_WORKERS:
+        return
+    try:
+        worker_cores = _CORE_SPLIT[1]
+        with _pin_lock:
+            core = worker_cores[_pin_next % len(worker_cores)]
+            _pin_next += 1
+        os.sched_setaffinity(pid, {core})
+    except OSError:
+        pass
+
 # 
 # STATE MONITOR (OPTIMISTIC CONCURRENCY CONTROL)
 # 
@@ -563,10 +609,35 @@ if TYPE_CHECKING:
 
 def send_json(sock: socket.socket, data: dict, timeout: float = 30.0):
     """Sends a JSON dictionary over a socket with timeout protection."""
+    send_encoded(sock, json.dumps(data).encode("utf-8"), timeout=timeout)
+
+
+def send_encoded(sock: socket.socket, payload: bytes, timeout: float = 30.0):
+    """Sends an already JSON-encoded payload with the same framing as send_json."""
     sock.settimeout(timeout)
-    json_string = json.dumps(data)
-    length_prefix = len(json_string).to_bytes(8, "big")
-    sock.sendall(length_prefix + json_string.encode("utf-8"))
+    sock.sendall(len(payload).to_bytes(8, "big") + payload)
+
+
+@lru_cache(maxsize=256)
+def _encode_spec_code(spec: str, code: str) -> str:
+    """JSON members for a (spec, code) pair, without the enclosing braces."""
+    return json.dumps({"spec": spec, "code": code})[1:-1]
+
+
+def encode_request(req: dict) -> bytes:
+    """
+    JSON-encode a client request. The spec/code members are memoized, so a
+    loop that sends the same code string again only re-encodes the small
+    per-call fields (SHM names, shapes, ...) around it.
+    """
+    spec, code = req.get("spec"), req.get("code")
+    if not isinstance(spec, str) or not isinstance(code, str):
+        return json.dumps(req).encode("utf-8")
+    rest = json.dumps({k: v for k, v in req.items() if k not in ("spec", "code")})
+    head = _encode_spec_code(spec, code)
+    if rest == "{}":
+        return ("{" + head + "}").encode("utf-8")
+    return ("{" + head + ", " + rest[1:]).encode("utf-8")
 
 
 def recv_json(sock: socket.socket, timeout: float = 30.0) -> dict:
@@ -2137,6 +2208,11 @@ if _torch_available:
 if np is not None:
     _worker_globals['np'] = np
 
+# Compiled task code keyed by source text. Callers that reuse one code
+# template (passing per-call values via shm_in / input_data) compile once.
+_code_cache = {}
+_CODE_CACHE_MAX = 256
+
 # 
 # MAIN EXECUTION LOOP
 # 
@@ -2394,7 +2470,12 @@ while True:
         _pre_task_modules = set(sys.modules.keys())
         try:
             with redirect_stdout(stdout_buffer), redirect_stderr(stderr_buffer):
-                exec(worker_code + '\\nworker_result = locals().get("result", None)', exec_scope, exec_scope)
+                _code_obj = _code_cache.get(worker_code)
+                if _code_obj is None:
+                    _code_obj = compile(worker_code + '\\nworker_result = locals().get("result", None)', '<string>', 'exec')
+                    if len(_code_cache) < _CODE_CACHE_MAX:
+                        _code_cache[worker_code] = _code_obj
+                exec(_code_obj, exec_scope, exec_scope)
 
             # Copy result back to SHM if hybrid mode
             if is_cuda_request and out_meta and 'tensor_out' in exec_scope and arr_out is not None:
@@ -2718,6 +2799,7 @@ class PersistentWorker:
             preexec_fn=os.setsid if not IS_WINDOWS else None,
             creationflags=creationflags,
         )
+        _pin_worker(self.process.pid)
 
         # Start a single persistent reader thread to prevent deadlocks on Windows
         def _reader_thread():
@@ -3144,6 +3226,7 @@ class PersistentWorker:
             preexec_fn=os.setsid if not IS_WINDOWS else None,  #  Windows fix
             creationflags=creationflags,
         )
+        _pin_worker(self.process.pid)
 
         # Send setup command
         try:
@@ -3876,7 +3959,7 @@ class WorkerPoolDaemon:
         # This is the first thing the final daemon process should do to signal readiness.
         with open(PID_FILE, "w", encoding="utf-8") as f:
             f.write(str(os.getpid()))
-
+        _pin_dispatcher()
 
         # Set signal handlers for graceful shutdown
         try:
@@ -4126,6 +4209,8 @@ class WorkerPoolDaemon:
                     worker_tag     = req.get("worker_tag"),      # NEW (optional)
                     max_memory_mb  = req.get("max_memory_mb"),   # NEW (optional)
                 )
+            elif req["type"] == "execute_batch":
+                res = self._execute_batch(req.get("chains", []))
             elif req["type"] == "execute_cuda":
                 res = self._execute_cuda_code(
                     req["spec"],
@@ -5153,6 +5238,57 @@ class WorkerPoolDaemon:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _execute_batch(self, chains: list) -> dict:
+        """
+        Run several chains of execute requests from a single client round-trip.
+
+        Chains run concurrently, one thread each. Steps inside a chain run in
+        order and are linked: once a step fails, the rest of that chain is
+        answered with status CANCELED without being executed (the same
+        semantics as io_uring's IOSQE_IO_LINK). Every step result carries its
+        own ``elapsed_ms`` so callers can still time individual steps.
+        """
+        results = [[] for _ in chains]
+
+        def _run_chain(idx: int, steps: list):
+            for pos, step in enumerate(steps):
+                t0 = time.perf_counter()
+                try:
+                    res = self._execute_code(
+                        step["spec"],
+                        step["code"],
+                        step.get("shm_in", {}),
+                        step.get("shm_out", {}),
+                        python_exe    = step.get("python_exe"),
+                        worker_tag    = step.get("worker_tag"),
+                        max_memory_mb = step.get("max_memory_mb"),
+                    )
+                except Exception as e:
+                    res = {"success": False, "status": "ERROR", "error": str(e)}
+                res["elapsed_ms"] = (time.perf_counter() - t0) * 1000
+                results[idx].append(res)
+                if not res.get("success"):
+                    results[idx].extend(
+                        {"success": False, "status": "CANCELED",
+                         "error": f"linked step {pos} failed"}
+                        for _ in steps[pos + 1:]
+                    )
+                    return
+
+        threads = [
+            threading.Thread(target=_run_chain, args=(i, steps), daemon=True)
+            for i, steps in enumerate(chains)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        return {
+            "success": all(r.get("success") for chain in results for r in chain),
+            "results": results,
+        }
+
     def _get_install_lock_for_daemon(self, spec: str) -> filelock.FileLock:
         """
         Separate install lock (prevents duplicate installations).
@@ -6331,7 +6467,42 @@ class WorkerPool:
             self._workers.clear()
 
 
+class ShmBuffer:
+    """
+    A named shared-memory segment with an ndarray view, reusable across
+    execute_zero_copy() calls so a hot loop pays open/ftruncate/mmap/unlink
+    once instead of per call. Get one from DaemonClient.alloc_shm_buffer()
+    and close() it when done.
+    """
+
+    def __init__(self, shape, dtype):
+        from multiprocessing import shared_memory
+
+        import numpy as np
+
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        size = max(1, int(np.prod(self.shape)) * self.dtype.itemsize)
+        self.shm = shared_memory.SharedMemory(create=True, size=size)
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=self.shm.buf)
+
+    @property
+    def meta(self) -> dict:
+        return {"name": self.shm.name, "shape": self.shape, "dtype": str(self.dtype)}
+
+    def close(self):
+        self.array = None
+        try:
+            self.shm.close()
+            self.shm.unlink()
+        except Exception:
+            pass
+
+
 class DaemonClient:
+    # Process-wide cap on requests awaiting a response (see _send).
+    _inflight = threading.BoundedSemaphore(64)
+
     def __init__(
         self,
         socket_path: str = DEFAULT_SOCKET,
@@ -6473,6 +6644,32 @@ class DaemonClient:
             payload["max_memory_mb"] = max_memory_mb
         return self._send(payload)
 
+    def execute_batch(self, chains: list) -> dict:
+        """
+        Submit several chains of execute steps in one request.
+
+        Each chain is a list of step dicts using the same keys as
+        execute_shm() (spec, code, shm_in, shm_out, python_exe, ...).
+        Chains run concurrently inside the daemon; steps within a chain run
+        in order and a failed step cancels the remainder of its chain.
+
+        Returns dict with keys: success, results — ``results[i][j]`` is the
+        response of step j of chain i, including its ``elapsed_ms``.
+        """
+        payload_chains = [
+            [
+                {
+                    "shm_in": {},
+                    "shm_out": {},
+                    **step,
+                    "python_exe": _resolve_python_exe(step.get("python_exe")),
+                }
+                for step in chain
+            ]
+            for chain in chains
+        ]
+        return self._send({"type": "execute_batch", "chains": payload_chains})
+
     def status(self):
         old_auto = self.auto_start
         self.auto_start = False
@@ -6662,20 +6859,23 @@ class DaemonClient:
                 # Get platform-appropriate connection info
                 sock_family, address = self._get_connection_info()
 
-                # Create and connect socket
-                sock = socket.socket(sock_family, socket.SOCK_STREAM)
-                sock.settimeout(self.timeout)
-                sock.connect(address)
-                _t_connected = time.perf_counter()
+                # Bound in-flight requests: a caller that outruns the daemon
+                # blocks here until an earlier response comes back.
+                with DaemonClient._inflight:
+                    # Create and connect socket
+                    sock = socket.socket(sock_family, socket.SOCK_STREAM)
+                    sock.settimeout(self.timeout)
+                    sock.connect(address)
+                    _t_connected = time.perf_counter()
 
-                # Send request and receive response
-                send_json(sock, req, timeout=self.timeout)
-                _t_sent = time.perf_counter()
+                    # Send request and receive response
+                    send_encoded(sock, encode_request(req), timeout=self.timeout)
+                    _t_sent = time.perf_counter()
 
-                res = recv_json(sock, timeout=self.timeout)
-                _t_recvd = time.perf_counter()
+                    res = recv_json(sock, timeout=self.timeout)
+                    _t_recvd = time.perf_counter()
 
-                sock.close()
+                    sock.close()
 
                 if _perf:
                     _perf.record(
@@ -7416,6 +7616,10 @@ class DaemonClient:
             except:
                 pass
 
+    def alloc_shm_buffer(self, shape, dtype) -> ShmBuffer:
+        """Allocate a reusable SHM buffer for execute_zero_copy(input_buffer=/output_buffer=)."""
+        return ShmBuffer(shape, dtype)
+
     def execute_zero_copy(
         self,
         spec: str,
@@ -7427,35 +7631,25 @@ class DaemonClient:
         worker_tag: str = None,
             pin: bool = False,          # NEW: worker survives idle timeout indefinitely
         max_memory_mb: float = None,
+        input_buffer: ShmBuffer = None,
+        output_buffer: ShmBuffer = None,
     ):
         """
          HFT MODE: Zero-Copy Tensor Handoff via Shared Memory.
-        """
-        from multiprocessing import shared_memory
 
-        import numpy as np
-
-        shm_in = shared_memory.SharedMemory(create=True, size=input_array.nbytes)
-
-        start_shm = np.ndarray(input_array.shape, dtype=input_array.dtype, buffer=shm_in.buf)
-        start_shm[:] = input_array[:]
-
-        dummy = np.zeros(1, dtype=output_dtype)
-        out_size = int(np.prod(output_shape)) * dummy.itemsize
-        shm_out = shared_memory.SharedMemory(create=True, size=out_size)
+        input_buffer / output_buffer are optional ShmBuffers from
+        alloc_shm_buffer(); when given they are reused (and left open)
+        instead of creating and unlinking fresh segments for this call.
+        """
+        own_in = input_buffer is None
+        own_out = output_buffer is None
+        shm_in = ShmBuffer(input_array.shape, input_array.dtype) if own_in else input_buffer
+        shm_in.array[...] = input_array
+        shm_out = ShmBuffer(output_shape, output_dtype) if own_out else output_buffer
 
         try:
-            in_meta = {
-                "name": shm_in.name,
-                "shape": input_array.shape,
-                "dtype": str(input_array.dtype),
-            }
-
-            out_meta = {
-                "name": shm_out.name,
-                "shape": output_shape,
-                "dtype": str(output_dtype),
-            }
+            in_meta = shm_in.meta
+            out_meta = shm_out.meta
 
             # Pass python_exe to execute_shm
             response = self.execute_shm(
@@ -7468,20 +7662,74 @@ class DaemonClient:
             if not response.get("success"):
                 raise RuntimeError(_('Worker Error: {}').format(response.get('error')))
 
-            result_view = np.ndarray(output_shape, dtype=output_dtype, buffer=shm_out.buf)
-            return result_view.copy(), response
+            return shm_out.array.copy(), response
 
         finally:
-            try:
+            if own_in:
                 shm_in.close()
-                shm_in.unlink()
-            except:
-                pass
-            try:
+            if own_out:
                 shm_out.close()
-                shm_out.unlink()
-            except:
-                pass
+
+    def execute_zero_copy_batch(
+        self,
+        specs: list,
+        codes: list,
+        inputs: list,
+        output_shapes: list,
+        output_dtype="float64",
+        python_exe=None,
+        buffers: list = None,
+    ):
+        """
+        Several execute_zero_copy() calls in one daemon round-trip.
+
+        Sub-request i runs codes[i] under specs[i] with inputs[i] as arr_in
+        and an output_shapes[i] arr_out. They are sent as independent
+        single-step chains of execute_batch(), so the daemon runs them
+        concurrently and one failure does not cancel the others.
+        buffers, if given, is a list of (input_buffer, output_buffer)
+        ShmBuffer pairs to reuse instead of fresh segments.
+
+        Returns a list of (result_arr, response) tuples; response carries the
+        sub-request's own ``elapsed_ms``. Raises RuntimeError if any failed.
+        """
+        owned = []
+        try:
+            pairs = []
+            chains = []
+            for i, (spec, code, arr, shape) in enumerate(zip(specs, codes, inputs, output_shapes)):
+                if buffers is not None:
+                    shm_in, shm_out = buffers[i]
+                else:
+                    shm_in = ShmBuffer(arr.shape, arr.dtype)
+                    owned.append(shm_in)
+                    shm_out = ShmBuffer(shape, output_dtype)
+                    owned.append(shm_out)
+                shm_in.array[...] = arr
+                pairs.append((shm_in, shm_out))
+                chains.append([{
+                    "spec": spec,
+                    "code": code,
+                    "shm_in": shm_in.meta,
+                    "shm_out": shm_out.meta,
+                    "python_exe": python_exe,
+                }])
+
+            response = self.execute_batch(chains)
+            results = response.get("results")
+            if not results:
+                raise RuntimeError(_('Worker Error: {}').format(response.get('error')))
+
+            out = []
+            for (step,), (unused, shm_out) in zip(results, pairs):
+                if not step.get("success"):
+                    raise RuntimeError(_('Worker Error: {}').format(step.get('error')))
+                out.append((shm_out.array.copy(), step))
+            return out
+
+        finally:
+            for shm in owned:
+                shm.close()
 
     def execute_smart(
     self,
@@ -7618,6 +7866,28 @@ class DaemonClient:
                     "transport": "JSON"}
         return response
 
+    _async_executor = None
+    _async_executor_lock = threading.Lock()
+
+    def execute_smart_async(self, spec: str, code: str, **kwargs):
+        """
+        Non-blocking execute_smart(): returns a concurrent.futures.Future
+        whose result() is the same dict execute_smart() would return.
+
+        Every request already travels on its own socket connection, so
+        calls to different workers overlap and the total wait is roughly
+        the slowest call rather than the sum of them.
+        """
+        if DaemonClient._async_executor is None:
+            with DaemonClient._async_executor_lock:
+                if DaemonClient._async_executor is None:
+                    DaemonClient._async_executor = ThreadPoolExecutor(
+                        max_workers=16, thread_name_prefix="daemon-client"
+                    )
+        return DaemonClient._async_executor.submit(
+            self.execute_smart, spec, code, **kwargs
+        )
+
 
 class DaemonProxy:
     """Proxies calls from Loader to the Daemon via Socket/SHM"""
@@ -2,46 +2,143 @@ from omnipkg.common_utils import safe_print
 import sys
 import subprocess
 import json
+import pickle
+import re
+import asyncio
+import contextlib
+import socket
 import time
+import collections
 import concurrent.futures
 import threading
+import traceback
+from multiprocessing import shared_memory
 from omnipkg.i18n import _
+# Imported once here: the worker threads would otherwise each take the import
+# lock, and a missing daemon module fails at startup instead of mid-benchmark.
+from omnipkg.isolation.worker_daemon import DaemonClient, DAEMON_LOG_FILE, PID_FILE, cli_stop
+from omnipkg.utils._spawn import HAS_SPAWN, SpawnedProcess
+
+try:
+    # Optional: much lower per-submit overhead than concurrent.futures
+    from fastthreadpool import Pool as _FastPool
+except ImportError:
+    _FastPool = None
 
 print_lock = threading.Lock()
 
 import os as _os
-_WIN_ENV = {
-    **_os.environ,
+
+# Child environment built once from os.environ minus a small denylist of
+# interactive-shell state (prompt hooks, colour tables, history) that no
+# adopt/install/daemon child reads. Everything else is kept, since a
+# missing LD_LIBRARY_PATH/DYLD_* or Windows system variable only shows up
+# as a CI failure on the hostedtoolcache interpreters.
+_ENV_DROP = (
+    "LS_COLORS", "LSCOLORS", "PS1", "PS2", "PROMPT_COMMAND", "HISTFILE",
+    "HISTSIZE", "HISTFILESIZE", "HISTCONTROL", "OLDPWD", "PYTHONSTARTUP",
+)
+_WIN_ENV = {k: v for k, v in _os.environ.items() if k not in _ENV_DROP}
+_WIN_ENV.update({
     "PYTHONIOENCODING": "utf-8",
     "PYTHONUTF8": "1",
     "PYTHONUNBUFFERED": "1",
     "OMNIPKG_NONINTERACTIVE": "1",
     "OMNIPKG_DEBUG": "1",
-}
-_SP = dict(encoding="utf-8", errors="replace", env=_WIN_ENV)
+    "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+})
+# Block-buffered pipes and a closed stdin for every child we capture output from
+_SP = dict(encoding="utf-8", errors="replace", env=_WIN_ENV,
+           bufsize=-1, stdin=subprocess.DEVNULL)
+
+# OMNIPKG_BENCH_BATCH=1 submits Phases 2-4 as one linked daemon batch
+_BATCH_MODE = _os.environ.get("OMNIPKG_BENCH_BATCH") == "1"
+# OMNIPKG_BENCH_FORCE_INSTALL=1 always runs the Phase 0 dispatcher install,
+# even when the target interpreter already has the requested version
+_FORCE_INSTALL = _os.environ.get("OMNIPKG_BENCH_FORCE_INSTALL") == "1"
+# Phase 0 install: hard kill after this many seconds; keep this many output lines
+_INSTALL_TIMEOUT = 300.0
+_INSTALL_TAIL_LINES = 200
+
+
+# Pre-bound formatters: no f-string/format-spec parsing per call
+_FMT_US = "{:.1f}µs".format
+_FMT_MS = "{:.1f}ms".format
+_FMT_S = "{:.2f}s".format
 
 
 def format_duration(ms: float) -> str:
     if ms < 1:
-        return f"{ms*1000:.1f}µs"
-    elif ms < 1000:
-        return f"{ms:.1f}ms"
-    else:
-        return f"{ms/1000:.2f}s"
+        return _FMT_US(ms * 1000)
+    if ms < 1000:
+        return _FMT_MS(ms)
+    return _FMT_S(ms / 1000)
+
+
+def _pin_thread(thread_id: int):
+    """
+    Pin the calling thread to its own CPU (Linux only) so the scheduler
+    doesn't migrate it between cores mid-measurement. No-op elsewhere.
+    """
+    try:
+        cores = sorted(_os.sched_getaffinity(0))
+        _os.sched_setaffinity(0, {cores[(thread_id - 1) % len(cores)]})
+    except (AttributeError, OSError):
+        pass
+
+
+def _format_block(prefix: str, tag: str, text: str) -> str:
+    return "".join(f"{prefix} [{tag}] {ln}\n" for ln in text.splitlines())
+
+
+def _dump_block(prefix: str, tag: str, text: str):
+    """Print a multi-line buffer as one write under print_lock, not one per line."""
+    if not text:
+        return
+    buf = _format_block(prefix, tag, text)
+    with print_lock:
+        safe_print(buf, end="")
+
+
+# Byte offset of the last dump per label — repeated dumps only show new lines.
+_LOG_OFFSETS: dict = {}
+# Read budget per requested tail line (daemon log lines are well under this)
+_LOG_BYTES_PER_LINE = 512
 
 
 def dump_daemon_log(label: str = "DAEMON LOG DUMP", only_on_error: bool = True, max_lines: int = 50):
-    """Dump last max_lines of daemon log. By default only prints if the log contains ERROR/EXCEPTION."""
+    """
+    Dump the last max_lines of daemon log written since the previous dump with
+    the same label. By default only prints if those lines contain ERROR/EXCEPTION.
+    """
     try:
-        from omnipkg.isolation.worker_daemon import DAEMON_LOG_FILE
         if not _os.path.exists(DAEMON_LOG_FILE):
             if not only_on_error:
                 safe_print(f"[DAEMON LOG] ❌ DOES NOT EXIST: {DAEMON_LOG_FILE}")
             return
-        with open(DAEMON_LOG_FILE, "r", errors="replace") as f:
-            lines = f.readlines()
+        size = _os.path.getsize(DAEMON_LOG_FILE)
+        last = _LOG_OFFSETS.get(label, 0)
+        if size < last:
+            # Log was truncated/rotated — start over from the beginning
+            last = 0
+        if size == last:
+            if not only_on_error:
+                safe_print(f"[DAEMON LOG] (no new log lines) {label}")
+            return
+
+        # Seek to a bounded window at the end of the delta: the read is
+        # O(max_lines), not O(log size), and only those lines are kept.
+        start = max(last, size - max_lines * _LOG_BYTES_PER_LINE)
+        with open(DAEMON_LOG_FILE, "rb") as f:
+            f.seek(start)
+            chunk = f.read(size - start)
+        lines = chunk.decode("utf-8", "replace").splitlines(keepends=True)
+        if start > last and lines:
+            lines = lines[1:]  # first line is cut by the window
+        tail = collections.deque(lines, maxlen=max_lines)
+        _LOG_OFFSETS[label] = size
+
         # In only_on_error mode, skip dump entirely if no errors in last max_lines
-        tail = lines[-max_lines:]
         has_error = any(
             any(kw in ln for kw in ("ERROR", "EXCEPTION", "Traceback", "❌"))
             for ln in tail
@@ -49,32 +146,70 @@ def dump_daemon_log(label: str = "DAEMON LOG DUMP", only_on_error: bool = True,
         if only_on_error and not has_error:
             return
         safe_print(f"\n{'='*80}")
-        safe_print(f"📋 {label}  [{len(lines)} total lines, showing last {len(tail)}]")
+        safe_print(f"📋 {label}  [{size - last} new bytes, showing last {len(tail)} lines]")
         safe_print(f"{'='*80}")
         for ln in tail:
             safe_print(f"[DAEMON] {ln.rstrip()}")
         safe_print(f"{'='*80}\n")
     except Exception as e:
         safe_print(f"[LOG DUMP ERROR] {e}")
-        import traceback
         safe_print(traceback.format_exc())
 
 
-def _run_info_python() -> str:
-    result = subprocess.run(
-        ["omnipkg", "info", "python"],
-        capture_output=True,
-        **_SP,
-    )
-    return result.stdout or ""
+def _spawn(argv: list, env: dict):
+    if HAS_SPAWN:
+        # stdout and stderr stay inherited so a failing adopt reaches the CI log
+        return SpawnedProcess(argv, env)
+    return subprocess.Popen(argv, env=env, stdin=subprocess.DEVNULL)
 
 
-def _read_registry() -> dict:
+def _wait_exit(proc, timeout: float):
     """
-    Read the interpreter registry directly from disk — never relies on a
-    subprocess that might return empty output in CI / temp-script contexts.
-    Searches sys.prefix and CONDA_PREFIX for the registry.json.
+    Block until proc exits or timeout elapses; returns the exit code or None.
+    Wakes on the exit itself (pidfd / Popen.wait), not on a sleep interval.
     """
+    try:
+        return proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None
+
+
+def _run_info_python() -> str:
+    argv = ["omnipkg", "info", "python"]
+    if not HAS_SPAWN:
+        result = subprocess.run(argv, capture_output=True, **_SP)
+        return result.stdout or ""
+    r, w = _os.pipe()
+    try:
+        proc = SpawnedProcess(argv, _WIN_ENV, stdout_fd=w)
+    except BaseException:
+        _os.close(r)
+        raise
+    finally:
+        _os.close(w)
+    with open(r, "rb") as f:
+        out = f.read()
+    proc.wait()
+    return out.decode("utf-8", "replace")
+
+
+def _installed_version(python_exe: str, dist: str):
+    """Version of dist visible to python_exe's own site-packages, or None."""
+    probe = (
+        "import importlib.metadata as m, sys\n"
+        "try: print(m.version(sys.argv[1]))\n"
+        "except m.PackageNotFoundError: pass"
+    )
+    try:
+        result = subprocess.run(
+            [python_exe, "-c", probe, dist], capture_output=True, timeout=30, **_SP
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return (result.stdout or "").strip() or None
+
+
+def _registry_candidates() -> list:
     candidates = []
     # sys.prefix — works in hostedtoolcache and venv environments
     candidates.append(
@@ -86,6 +221,71 @@ def _read_registry() -> dict:
         candidates.append(
             _os.path.join(conda, ".omnipkg", "interpreters", "registry.json")
         )
+    return candidates
+
+
+def _registry_mtime() -> float:
+    """Newest mtime across the registry candidates (0.0 if none exist)."""
+    mtime = 0.0
+    for path in _registry_candidates():
+        try:
+            mtime = max(mtime, _os.stat(path).st_mtime)
+        except OSError:
+            pass
+    return mtime
+
+
+def _wait_for(predicate, timeout: float, first_delay: float = 0.005, max_delay: float = 0.25) -> bool:
+    """
+    Wait until predicate() is true, re-checking with exponential backoff
+    (5ms, 10ms, 20ms, ... capped at max_delay) instead of a fixed sleep.
+    Returns False if timeout elapses first.
+    """
+    deadline = time.monotonic() + timeout
+    delay = first_delay
+    while True:
+        if predicate():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+
+
+# One DaemonClient shared by every phase/thread. The client holds no
+# per-request state (each call opens its own connection), so sharing is safe.
+_DAEMON_CLIENT = None
+_daemon_lock = threading.Lock()
+
+
+def get_daemon_client() -> DaemonClient:
+    global _DAEMON_CLIENT
+    if _DAEMON_CLIENT is None:
+        with _daemon_lock:
+            if _DAEMON_CLIENT is None:
+                _DAEMON_CLIENT = DaemonClient()
+    return _DAEMON_CLIENT
+
+
+def _daemon_connectable(client) -> bool:
+    """Cheap readiness probe: can we connect to the daemon's socket at all?"""
+    try:
+        family, address = client._get_connection_info()
+        with socket.socket(family, socket.SOCK_STREAM) as s:
+            s.settimeout(0.5)
+            return s.connect_ex(address) == 0
+    except OSError:
+        return False
+
+
+def _read_registry() -> dict:
+    """
+    Read the interpreter registry directly from disk — never relies on a
+    subprocess that might return empty output in CI / temp-script contexts.
+    Searches sys.prefix and CONDA_PREFIX for the registry.json.
+    """
+    candidates = _registry_candidates()
     for path in candidates:
         if _os.path.exists(path):
             try:
@@ -100,39 +300,88 @@ def _read_registry() -> dict:
     return {}
 
 
+# Interpreter map (in-process, or parsed `omnipkg info python` output), built
+# once and shared by every caller/thread.
+# Refreshed after _INFO_TTL seconds or as soon as the registry file changes.
+_INFO_TTL = 2.0
+_INFO_CACHE = {"ts": 0.0, "mtime": None, "out": "", "map": {}}
+_info_lock = threading.RLock()
+
+
+_PY_LINE_RE = re.compile(r"Python (\S+):[ \t]+(\S+)")
+
+
+def _parse_info(output: str) -> dict:
+    """Parse 'Python X.Y: /path/to/python ...' lines into {version: path}."""
+    mapping = {}
+    for m in _PY_LINE_RE.finditer(output):
+        mapping.setdefault(m.group(1), m.group(2))
+    return mapping
+
+
+_interp_manager = None
+
+
+def _inprocess_info():
+    """
+    {version: path} straight from omnipkg's InterpreterManager — the same data
+    `omnipkg info python` prints, minus the interpreter startup and stdout
+    parsing. Returns None if omnipkg.core can't be used here, so the caller
+    falls back to the subprocess.
+    """
+    global _interp_manager
+    try:
+        if _interp_manager is None:
+            from omnipkg.core import ConfigManager, InterpreterManager
+            _interp_manager = InterpreterManager(ConfigManager(suppress_init_messages=True))
+        else:
+            _interp_manager.refresh_registry()
+        return {v: str(p) for v, p in _interp_manager.list_available_interpreters().items()}
+    except Exception as e:
+        safe_print(f"[DEBUG-REGISTRY] in-process lookup unavailable ({e}) — using subprocess")
+        return None
+
+
+def _get_info(force: bool = False) -> dict:
+    with _info_lock:
+        now = time.monotonic()
+        mtime = _registry_mtime()
+        if force or now - _INFO_CACHE["ts"] > _INFO_TTL or mtime != _INFO_CACHE["mtime"]:
+            mapping = _inprocess_info()
+            if mapping:
+                _INFO_CACHE.update(ts=now, mtime=mtime, out="", map=mapping)
+            else:
+                out = _run_info_python()
+                _INFO_CACHE.update(ts=now, mtime=mtime, out=out, map=_parse_info(out))
+        return _INFO_CACHE
+
+
 def verify_registry_contains(version: str) -> bool:
     try:
         registry = _read_registry()
         if version in registry.get("interpreters", {}):
             return True
-        # fallback to subprocess output
-        output = _run_info_python()
-        for line in output.splitlines():
-            if f"Python {version}:" in line:
-                return True
+        # fallback to (cached) subprocess output
+        return version in _get_info()["map"]
     except Exception:
         return False
-    return False
 
 
-def get_interpreter_path(version: str) -> str:
-    registry = _read_registry()
+def get_interpreter_path(version: str, registry: dict = None) -> str:
+    if registry is None:
+        registry = _read_registry()
     interpreters = registry.get("interpreters", {})
     if version in interpreters:
         path = interpreters[version]
         safe_print(f"[DEBUG-REGISTRY] Resolved {version} -> {path}")
         return path
-    # fallback to subprocess output parsing
+    # fallback to (cached) subprocess output
     try:
-        output = _run_info_python()
+        info_map = _get_info()["map"]
     except Exception as e:
         raise RuntimeError(_('Failed to query omnipkg: {}').format(e)) from e
-    for line in output.splitlines():
-        if f"Python {version}:" in line:
-            parts = line.split(": ", 1)
-            if len(parts) == 2:
-                path_part = parts[1].strip().split()[0]
-                return path_part
+    if version in info_map:
+        return info_map[version]
     raise RuntimeError(_('Python {} not found in registry').format(version))
 
 
@@ -142,11 +391,17 @@ def adopt_if_needed(version: str, poll_interval: float = 5.0, timeout: float = 3
         return True
 
     safe_print(_('   🚀 Adopting Python {}...').format(version))
-    proc = subprocess.Popen(["omnipkg", "python", "adopt", version], env=_WIN_ENV)
+    registry_mtime = _registry_mtime()
+    proc = _spawn(["omnipkg", "python", "adopt", version], _WIN_ENV)
     deadline = time.monotonic() + timeout
 
-    while time.monotonic() < deadline:
-        rc = proc.poll()
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        # Returns as soon as adopt exits; the interval only bounds how often
+        # the registry is re-checked while it is still running.
+        rc = _wait_exit(proc, min(poll_interval, remaining))
         if verify_registry_contains(version):
             if rc is None:
                 proc.wait()
@@ -154,16 +409,17 @@ def adopt_if_needed(version: str, poll_interval: float = 5.0, timeout: float = 3
             return True
         if rc is not None:
             if rc == 0:
-                time.sleep(1)
+                # Bounded wait for the registry write to land, not a fixed sleep
+                _wait_for(lambda: _registry_mtime() != registry_mtime, timeout=1.0)
                 if verify_registry_contains(version):
                     safe_print(_('   ✅ Python {} confirmed in registry.').format(version))
                     return True
             safe_print(_('   ❌ Adopt exited (rc={}) but {} not in registry.').format(rc, version))
             return False
         safe_print(_('   ⏳ Waiting for Python {}...').format(version))
-        time.sleep(poll_interval)
 
     proc.kill()
+    proc.wait()
     safe_print(_('   ❌ Adopt timed out after {}s').format(int(timeout)))
     return False
 
@@ -175,8 +431,7 @@ def ensure_daemon_running(interpreter_paths: list) -> bool:
     are adopted so the daemon registry sees them on startup.
     """
     try:
-        from omnipkg.isolation.worker_daemon import DaemonClient, PID_FILE
-        client = DaemonClient()
+        client = get_daemon_client()
         status = client.status()
 
         if status.get("success"):
@@ -185,31 +440,30 @@ def ensure_daemon_running(interpreter_paths: list) -> bool:
             safe_print("   🔄 Starting daemon (all pythons already adopted)...")
             proc = subprocess.Popen(
                 ["8pkg", "daemon", "start"],
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
             )
             
-            # --- NEW ROBUST WAITING LOGIC ---
-            safe_print(f"   ⏳ Waiting for PID file at: {PID_FILE}")
-            deadline = time.monotonic() + 60.0  # Wait up to 60 seconds
-            pid_file_found = False
-            while time.monotonic() < deadline:
-                import os
-                if os.path.exists(PID_FILE):
-                    safe_print("   ✅ PID file appeared.")
-                    pid_file_found = True
-                    break
-                time.sleep(0.5)
-            
-            if not pid_file_found:
-                safe_print(f"   ❌ Timed out waiting for PID file after 60s.")
+            # `daemon start` daemonizes with wait_for_ready=True, so the
+            # launcher exits once the daemon is up — block on that exit
+            # instead of polling for the PID file.
+            safe_print("   ⏳ Waiting for daemon launcher to report ready...")
+            if _wait_exit(proc, timeout=60.0) is None:
+                proc.kill()
+                safe_print("   ❌ Timed out waiting for daemon launcher after 60s.")
                 # It's still useful to dump the log if it exists
-                dump_daemon_log("DAEMON LOG ON PID TIMEOUT", only_on_error=False)
+                dump_daemon_log("DAEMON LOG ON START TIMEOUT", only_on_error=False)
                 return False
+            if not _os.path.exists(PID_FILE):
+                safe_print(f"   ❌ Launcher exited but no PID file at: {PID_FILE}")
+                dump_daemon_log("DAEMON LOG ON PID MISSING", only_on_error=False)
+                return False
+            safe_print("   ✅ Daemon launcher finished, PID file present.")
+
+            # Normally already bound by now; bounded probe covers slow binds
+            _wait_for(lambda: _daemon_connectable(client), timeout=5.0)
 
-            # Give it a couple more seconds for the socket to bind after PID is written
-            time.sleep(2) 
-            
             # Now verify connection
             status = client.status()
             if status.get("success"):
@@ -222,71 +476,162 @@ def ensure_daemon_running(interpreter_paths: list) -> bool:
         return True
 
     except Exception as e:
-        import traceback
         safe_print(f"   ❌ Daemon error: {e}")
         safe_print(traceback.format_exc())
         return False
 
 
-def warmup_worker(config: tuple, thread_id: int) -> dict:
-    py_version, rich_version = config
-    prefix = f"[T{thread_id}|Warmup]"
+# Worker → client report slot: [len:u32 little-endian][payload]. The payload is
+# utf-8 text for diagnostics, or a pickle (protocol 4, readable by every
+# supported Python) for structured results — the daemon is trusted. The
+# segment name travels in shm_out as a plain dict (no shape/dtype), so the
+# daemon passes it through to the worker's input_data untouched.
+_SHM_REPORT_SIZE = 64 * 1024
 
+_SHM_WRITER = """
+from multiprocessing import shared_memory as _shm_mod
+def _shm_write(payload):
+    seg = _shm_mod.SharedMemory(name=input_data["shm_out"]["report"])
     try:
-        python_exe = get_interpreter_path(py_version)
+        data = payload if isinstance(payload, bytes) else payload.encode("utf-8")
+        data = data[: seg.size - 4]
+        seg.buf[4:4 + len(data)] = data
+        seg.buf[:4] = len(data).to_bytes(4, "little")
+    finally:
+        seg.close()
+"""
 
-        safe_print(f"{prefix} 🐍 interpreter : {python_exe}")
-        safe_print(f"{prefix} 🎯 target      : Python {py_version} + rich=={rich_version}")
-        safe_print(f"{prefix} 🧵 thread ident: {threading.get_ident()}")
 
-        from omnipkg.isolation.worker_daemon import DaemonClient
-        client = DaemonClient()
+@contextlib.contextmanager
+def _shm_report(size: int = _SHM_REPORT_SIZE):
+    seg = shared_memory.SharedMemory(create=True, size=size)
+    seg.buf[:4] = bytes(4)
+    try:
+        yield seg
+    finally:
+        seg.close()
+        seg.unlink()
 
-        safe_print(f"{prefix} 🔥 Warming up...")
-        start = time.perf_counter()
 
-        # NOTE: rich.__version__ does NOT exist in rich>=13 — must use importlib.metadata
-        warmup_code = f"""
+def _read_shm_bytes(seg) -> bytes:
+    n = int.from_bytes(seg.buf[:4], "little")
+    return bytes(seg.buf[4:4 + n])
+
+
+def _read_shm_report(seg) -> str:
+    return _read_shm_bytes(seg).decode("utf-8", "replace")
+
+
+def _read_shm_pickle(seg) -> dict:
+    data = _read_shm_bytes(seg)
+    return pickle.loads(data) if data else {}
+
+
+# Worker-side metadata lookup memo. Task code runs in the worker's persistent
+# globals, so the memo survives across RPCs to the same worker; it is keyed on
+# the module's file, so a different rich on disk is always looked up afresh.
+_META_CACHE = """
+import importlib.metadata
+if "_dist_version" not in globals():
+    _dist_versions = {}
+    def _dist_version(mod):
+        key = (mod.__name__, mod.__file__)
+        v = _dist_versions.get(key)
+        if v is None:
+            v = _dist_versions[key] = importlib.metadata.version(mod.__name__)
+        return v
+"""
+
+
+# Static code templates: per-call values (rich_version, thread_id) arrive as
+# data in input_data["shm_in"], so every call sends identical source and the
+# worker can reuse its compiled code object.
+
+# NOTE: rich.__version__ does NOT exist in rich>=13 — must use importlib.metadata
+# Diagnostics go into the shared-memory report slot, not through stdout.
+_WARMUP_CODE = _SHM_WRITER + _META_CACHE + """
 import sys, importlib.metadata
-print(f"[WORKER:{thread_id}] exe={{sys.executable}}")
-print(f"[WORKER:{thread_id}] py={{sys.version}}")
-print(f"[WORKER:{thread_id}] rich target={rich_version}")
+_params = input_data["shm_in"]
+_tid, _want = _params["thread_id"], _params["rich_version"]
+_report = []
+try:
+    _report.append(f"[WORKER:{_tid}] exe={sys.executable}")
+    _report.append(f"[WORKER:{_tid}] py={sys.version}")
+    _report.append(f"[WORKER:{_tid}] rich target={_want}")
+
+    from omnipkg.loader import omnipkgLoader
+    with omnipkgLoader(f"rich=={_want}"):
+        import rich
+        actual = _dist_version(rich)
+        _report.append(f"[WORKER:{_tid}] rich.__file__={rich.__file__}")
+        _report.append(f"[WORKER:{_tid}] rich version={actual}")
+        assert actual == _want, f"VERSION MISMATCH: wanted {_want} got {actual} in {sys.executable}"
+finally:
+    _shm_write("\\n".join(_report))
+"""
 
+# The benchmark load doubles as verification: while rich is imported under
+# the loader, its metadata goes into the shm report slot (pickled), so no
+# separate verify round-trip is needed.
+# importlib.metadata — not rich.__version__
+_BENCHMARK_CODE = _SHM_WRITER + _META_CACHE + """
+import sys, pickle, importlib.metadata
 from omnipkg.loader import omnipkgLoader
-with omnipkgLoader("rich=={rich_version}"):
+with omnipkgLoader(f"rich=={input_data['shm_in']['rich_version']}"):
     import rich
-    actual = importlib.metadata.version('rich')
-    print(f"[WORKER:{thread_id}] rich.__file__={{rich.__file__}}")
-    print(f"[WORKER:{thread_id}] rich version={{actual}}")
-    assert actual == "{rich_version}", f"VERSION MISMATCH: wanted {rich_version} got {{actual}} in {{sys.executable}}"
+    _shm_write(pickle.dumps({
+        "python_version": sys.version.split()[0],
+        "python_path": sys.executable,
+        "rich_version": _dist_version(rich),
+        "rich_file": rich.__file__
+    }, protocol=4))
 """
 
+
+def _params(thread_id: int, rich_version: str) -> dict:
+    return {"thread_id": thread_id, "rich_version": rich_version}
+
+
+def warmup_worker(config: tuple, thread_id: int, python_exe: str) -> dict:
+    py_version, rich_version = config
+    prefix = f"[T{thread_id}|Warmup]"
+
+    _pin_thread(thread_id)
+
+    try:
+        safe_print(f"{prefix} 🐍 interpreter : {python_exe}")
+        safe_print(f"{prefix} 🎯 target      : Python {py_version} + rich=={rich_version}")
+        safe_print(f"{prefix} 🧵 thread ident: {threading.get_ident()}")
+
+        client = get_daemon_client()
+        execute = client.execute_shm
+
+        safe_print(f"{prefix} 🔥 Warming up...")
+        start = time.perf_counter()
+
         safe_print(f"{prefix} 📤 execute_shm spec=rich=={rich_version} python_exe={python_exe}")
 
-        result = client.execute_shm(
-            spec=f"rich=={rich_version}",
-            code=warmup_code,
-            shm_in={},
-            shm_out={},
-            python_exe=python_exe,
-        )
+        with _shm_report() as report:
+            result = execute(
+                spec=f"rich=={rich_version}",
+                code=_WARMUP_CODE,
+                shm_in=_params(thread_id, rich_version),
+                shm_out={"report": report.name, "size": report.size},
+                python_exe=python_exe,
+            )
+            report_text = _read_shm_report(report)
 
         elapsed = (time.perf_counter() - start) * 1000
 
         # Print every field — nothing hidden
         safe_print(f"{prefix} 📥 status : {result.get('status')}")
         safe_print(f"{prefix} 📥 success: {result.get('success')}")
-        if result.get("stdout"):
-            for line in result["stdout"].splitlines():
-                safe_print(f"{prefix} [stdout] {line}")
-        if result.get("stderr"):
-            for line in result["stderr"].splitlines():
-                safe_print(f"{prefix} [stderr] {line}")
+        _dump_block(prefix, "report", report_text)
+        _dump_block(prefix, "stdout", result.get("stdout"))
+        _dump_block(prefix, "stderr", result.get("stderr"))
         if result.get("error"):
             safe_print(f"{prefix} [error ] {result['error']}")
-        if result.get("traceback"):
-            for line in result["traceback"].splitlines():
-                safe_print(f"{prefix} [trace ] {line}")
+        _dump_block(prefix, "trace ", result.get("traceback"))
 
         if not result.get("success"):
             safe_print(f"{prefix} ❌ FAILED — dumping full daemon log")
@@ -303,37 +648,34 @@ with omnipkgLoader("rich=={rich_version}"):
 
     except Exception as e:
         safe_print(f"{prefix} ❌ EXCEPTION: {e}")
-        import traceback
         safe_print(traceback.format_exc())
         dump_daemon_log(f"DAEMON LOG AFTER T{thread_id} EXCEPTION")
         return None
 
 
-def benchmark_execution(config: tuple, thread_id: int, warmup_data: dict) -> dict:
+def benchmark_execution(config: tuple, thread_id: int, warmup_data: dict, python_exe: str) -> dict:
     py_version, rich_version = config
     prefix = f"[T{thread_id}]"
 
+    _pin_thread(thread_id)
+
     try:
-        python_exe = get_interpreter_path(py_version)
         safe_print(f"{prefix} ⚡ bench Python {py_version} + rich=={rich_version} via {python_exe}")
 
-        from omnipkg.isolation.worker_daemon import DaemonClient
-        client = DaemonClient()
-
-        benchmark_code = f"""
-from omnipkg.loader import omnipkgLoader
-with omnipkgLoader("rich=={rich_version}"):
-    import rich
-"""
-        start = time.perf_counter()
-        result = client.execute_shm(
-            spec=f"rich=={rich_version}",
-            code=benchmark_code,
-            shm_in={},
-            shm_out={},
-            python_exe=python_exe,
-        )
-        elapsed = (time.perf_counter() - start) * 1000
+        client = get_daemon_client()
+        execute = client.execute_shm
+
+        with _shm_report() as report:
+            start = time.perf_counter()
+            result = execute(
+                spec=f"rich=={rich_version}",
+                code=_BENCHMARK_CODE,
+                shm_in=_params(thread_id, rich_version),
+                shm_out={"report": report.name, "size": report.size},
+                python_exe=python_exe,
+            )
+            elapsed = (time.perf_counter() - start) * 1000
+            verify = _read_shm_pickle(report)
 
         if not result.get("success"):
             safe_print(f"{prefix} ❌ failed: {result.get('error')}")
@@ -347,6 +689,7 @@ with omnipkgLoader("rich=={rich_version}"):
             "rich_version": rich_version,
             "warmup_time": warmup_data["warmup_time"],
             "benchmark_time": elapsed,
+            "verify": {"thread_id": thread_id, **verify},
         }
 
     except Exception as e:
@@ -354,73 +697,191 @@ with omnipkgLoader("rich=={rich_version}"):
         return None
 
 
-def verify_execution(config: tuple, thread_id: int) -> dict:
-    py_version, rich_version = config
-    prefix = f"[T{thread_id}|Verify]"
+def run_linked_batch(test_configs: list, interpreter_paths: dict) -> tuple:
+    """
+    Submit warmup → benchmark for every config as linked chains in a
+    single DaemonClient.execute_batch() call. The daemon runs the chains
+    concurrently and stamps each step with elapsed_ms, so the per-phase
+    timings are daemon-side rather than client round-trip times. The benchmark
+    step also writes the verification metadata into its report slot.
+    Returns (benchmark_results, verify_results).
+    """
+    client = get_daemon_client()
+
+    chains = []
+    with contextlib.ExitStack() as stack:
+        reports = []
+        for i, (py_version, rich_version) in enumerate(test_configs):
+            thread_id = i + 1
+            python_exe = interpreter_paths[py_version]
+            spec = f"rich=={rich_version}"
+            params = _params(thread_id, rich_version)
+            report = stack.enter_context(_shm_report())
+            verify_slot = stack.enter_context(_shm_report())
+            reports.append((report, verify_slot))
+            chains.append([
+                {"spec": spec, "code": _WARMUP_CODE, "shm_in": params,
+                 "shm_out": {"report": report.name, "size": report.size},
+                 "python_exe": python_exe},
+                {"spec": spec, "code": _BENCHMARK_CODE, "shm_in": params,
+                 "shm_out": {"report": verify_slot.name, "size": verify_slot.size},
+                 "python_exe": python_exe},
+            ])
 
-    try:
-        python_exe = get_interpreter_path(py_version)
+        start = time.perf_counter()
+        response = client.execute_batch(chains)
+        safe_print(f"   📦 batch round-trip: {format_duration((time.perf_counter() - start) * 1000)}")
+        report_texts = [_read_shm_report(r) for r, unused in reports]
+        verify_payloads = [_read_shm_pickle(v) for unused, v in reports]
+
+    if "results" not in response:
+        safe_print(f"   ❌ batch failed: {response.get('error')}")
+        return [], []
+
+    benchmark_results, verify_results = [], []
+    for i, ((py_version, rich_version), steps) in enumerate(zip(test_configs, response["results"])):
+        thread_id = i + 1
+        prefix = f"[T{thread_id}|Batch]"
+        _dump_block(prefix, "report", report_texts[i])
+        warm, bench = steps
+        for name, step in (("warmup", warm), ("bench", bench)):
+            if not step.get("success"):
+                safe_print(f"{prefix} ❌ {name} {step.get('status')}: {step.get('error')}")
+                _dump_block(prefix, "trace ", step.get("traceback"))
+                break
+        else:
+            safe_print(
+                f"{prefix} ✅ warmup {format_duration(warm['elapsed_ms'])}  "
+                f"bench {format_duration(bench['elapsed_ms'])}"
+            )
+            benchmark_results.append({
+                "thread_id": thread_id,
+                "python_version": py_version,
+                "rich_version": rich_version,
+                "warmup_time": warm["elapsed_ms"],
+                "benchmark_time": bench["elapsed_ms"],
+            })
+            verify_results.append({"thread_id": thread_id, **verify_payloads[i]})
+    return benchmark_results, verify_results
 
-        from omnipkg.isolation.worker_daemon import DaemonClient
-        client = DaemonClient()
 
-        # importlib.metadata — not rich.__version__
-        verify_code = f"""
-import sys, json, importlib.metadata
-from omnipkg.loader import omnipkgLoader
-with omnipkgLoader("rich=={rich_version}"):
-    import rich
-    print(json.dumps({{
-        "python_version": sys.version.split()[0],
-        "python_path": sys.executable,
-        "rich_version": importlib.metadata.version('rich'),
-        "rich_file": rich.__file__
-    }}))
-"""
-        result = client.execute_shm(
-            spec=f"rich=={rich_version}",
-            code=verify_code,
-            shm_in={},
-            shm_out={},
-            python_exe=python_exe,
-        )
+class _PhaseFailed(Exception):
+    """A phase job returned a falsy result (it has already logged why)."""
 
-        if not result.get("success"):
-            raise RuntimeError(f"Verification failed: {result.get('error')}")
 
-        data = json.loads(result.get("stdout", "{}"))
-        safe_print(f"{prefix} ✅ Python {data['python_version']} + rich {data['rich_version']}")
-        safe_print(f"{prefix}    exe : {data['python_path']}")
-        safe_print(f"{prefix}    file: {data['rich_file']}")
-        return {"thread_id": thread_id, **data}
+def _fail_on_falsy(fn, *args):
+    result = fn(*args)
+    if not result:
+        raise _PhaseFailed(args)
+    return result
 
-    except Exception as e:
-        safe_print(f"{prefix} ❌ {e}")
-        return None
+
+def _run_phase(fn, jobs: list, fail_fast: bool = False) -> list:
+    """
+    Run fn(*args) concurrently for every args tuple in jobs and return the
+    truthy results in completion order. Uses fastthreadpool when installed,
+    ThreadPoolExecutor otherwise.
+
+    With fail_fast=True the first falsy result or exception ends the wait:
+    not-yet-started jobs are cancelled and the still-running ones are
+    abandoned, so a short result list comes back immediately.
+    """
+    if fail_fast:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(jobs))
+        futures = [executor.submit(_fail_on_falsy, fn, *args) for args in jobs]
+        done, pending = concurrent.futures.wait(
+            futures, return_when=concurrent.futures.FIRST_EXCEPTION
+        )
+        for f in pending:
+            f.cancel()
+        executor.shutdown(wait=False)
+        return [f.result() for f in done if f.exception() is None]
+    if _FastPool is not None:
+        pool = _FastPool(max_children=len(jobs))
+        for args in jobs:
+            pool.submit(fn, *args)
+        pool.shutdown()
+        return [r for r in pool.done if r]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(fn, *args) for args in jobs]
+        return [
+            r for r in (f.result() for f in concurrent.futures.as_completed(futures)) if r
+        ]
+
+
+async def _warmup_phase_async(jobs: list) -> list:
+    """
+    Phase 2 as an asyncio wait: each warmup's blocking daemon round-trip
+    runs in an executor thread and the coroutine just awaits the completions,
+    so concurrency is bounded by jobs, not a fixed pool size. The first failed
+    warmup ends the phase without waiting for the others.
+    """
+    loop = asyncio.get_running_loop()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(jobs))
+    try:
+        tasks = [
+            loop.run_in_executor(executor, _fail_on_falsy, warmup_worker, *args)
+            for args in jobs
+        ]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for t in pending:
+            t.cancel()
+        return [t.result() for t in done if t.exception() is None]
+    finally:
+        executor.shutdown(wait=False)
+
+
+def _abort(code: int = 1):
+    """
+    Exit without joining abandoned phase threads (sys.exit would wait for
+    every in-flight daemon call to finish first).
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    _os._exit(code)
 
 
 def print_benchmark_summary(results: list, total_time: float):
+    # results must already be in thread_id order (main() sorts each phase once)
     safe_print("\n" + "=" * 100)
     safe_print("📊 PRODUCTION BENCHMARK RESULTS")
     safe_print("=" * 100)
     safe_print(f"{'Thread':<8} {'Python':<12} {'Rich':<10} {'Warmup':<15} {'Benchmark':<15}")
     safe_print("-" * 100)
-    for r in sorted(results, key=lambda x: x["thread_id"]):
+    # Single pass: print rows and accumulate the stats at the same time
+    bt_sum = bt_max = wt_sum = 0.0
+    n = 0
+    for r in results:
+        b = r["benchmark_time"]
+        w = r["warmup_time"]
+        bt_sum += b
+        wt_sum += w
+        if b > bt_max:
+            bt_max = b
+        n += 1
         safe_print(
             f"T{r['thread_id']:<7} "
             f"{r['python_version']:<12} "
             f"{r['rich_version']:<10} "
-            f"{format_duration(r['warmup_time']):<15} "
-            f"{format_duration(r['benchmark_time']):<15}"
+            f"{format_duration(w):<15} "
+            f"{format_duration(b):<15}"
         )
     safe_print("-" * 100)
-    bt = [r["benchmark_time"] for r in results]
-    wt = [r["warmup_time"] for r in results]
-    seq = sum(bt)
-    conc = max(bt)
-    safe_print(f"⏱️  Sequential: {format_duration(seq)}  |  Concurrent: {format_duration(conc)}  |  Speedup: {seq/conc:.2f}x")
-    safe_print(f"   Warmup avg: {format_duration(sum(wt)/len(wt))}  |  Bench avg: {format_duration(sum(bt)/len(bt))}  |  Warmup→Hot: {sum(wt)/len(wt)/(sum(bt)/len(bt)):.1f}x")
+    bt_avg = bt_sum / n
+    wt_avg = wt_sum / n
+    safe_print(f"⏱️  Sequential: {format_duration(bt_sum)}  |  Concurrent: {format_duration(bt_max)}  |  Speedup: {bt_sum/bt_max:.2f}x")
+    safe_print(f"   Warmup avg: {format_duration(wt_avg)}  |  Bench avg: {format_duration(bt_avg)}  |  Warmup→Hot: {wt_avg/bt_avg:.1f}x")
+    safe_print("=" * 100)
+
+
+def print_verification_summary(results: list):
+    safe_print("\n" + "=" * 100)
+    safe_print("🔍 VERIFICATION RESULTS")
     safe_print("=" * 100)
+    for r in results:
+        safe_print(f"  T{r['thread_id']}: Python {r['python_version']}  rich={r['rich_version']}")
+        safe_print(f"         exe : {r['python_path']}")
+        safe_print(f"         file: {r['rich_file']}")
 
 
 def main():
@@ -439,25 +900,33 @@ def main():
     # Phase 1: Setup
     safe_print("\n📥 Phase 1: Setup")
     safe_print("-" * 100)
-    for version, unused in test_configs:
-        if not adopt_if_needed(version):
+    # Adoptions are independent downloads/installs — run them concurrently so
+    # Phase 1 costs max-of-adopt rather than sum-of-adopt.
+    versions = [version for version, unused in test_configs]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(versions)) as executor:
+        adopted = list(executor.map(adopt_if_needed, versions))
+    for version, ok in zip(versions, adopted):
+        if not ok:
             safe_print(f"❌ Failed to adopt Python {version}")
             sys.exit(1)
 
     # Resolve all interpreter paths AFTER adoption so daemon sees them all on start
     safe_print("\n🐍 Resolved interpreter paths:")
-    interpreter_paths = []
+    # One registry read for every version; workers get python_exe passed in
+    # rather than each re-resolving it.
+    registry = _read_registry()
+    interpreter_paths = {}
     for version, unused in test_configs:
         try:
-            path = get_interpreter_path(version)
-            interpreter_paths.append(path)
+            path = get_interpreter_path(version, registry)
+            interpreter_paths[version] = path
             safe_print(f"   Python {version} → {path}")
         except Exception as e:
             safe_print(f"   Python {version} → ❌ ERROR: {e}")
             sys.exit(1)
 
     # Start daemon BEFORE installs so FFI in-process path is live during install phase
-    if not ensure_daemon_running(interpreter_paths):
+    if not ensure_daemon_running(list(interpreter_paths.values())):
         safe_print("⚠️  Daemon failed to start — continuing to capture install/warmup behaviour")
         safe_print("⚠️  Phases 0-4 will still run; worker_daemon calls may fail with their own errors")
         dump_daemon_log("DAEMON LOG ON STARTUP FAILURE")
@@ -478,29 +947,50 @@ def main():
         prefix = f"[T{thread_id}|Install|{version}]"
         cmd_name = _versioned_cmd(version)
 
+        # rich ships wheels for every version under test — never fall back to
+        # an sdist build (and its isolated build env).
+        flags = ["--only-binary", ":all:"]
+
         # Build the command.  On Windows 'shell=True' is needed so .bat shims resolve.
         if sys.platform == "win32":
-            cmd = f"{cmd_name} install {pkg_spec}"
+            cmd = f"{cmd_name} install {pkg_spec} {' '.join(flags)}"
             use_shell = True
         else:
-            cmd = [cmd_name, "install", pkg_spec]
+            cmd = [cmd_name, "install", pkg_spec, *flags]
             use_shell = False
 
         env = {**_WIN_ENV, "OMNIPKG_DEBUG": "1"}
 
+        t0 = time.perf_counter()
+
+        # Warm reruns: verify first, only install on mismatch / not found
+        if not _FORCE_INSTALL:
+            dist, _sep, wanted = pkg_spec.partition("==")
+            if _installed_version(interpreter_paths[version], dist) == wanted:
+                elapsed = (time.perf_counter() - t0) * 1000
+                with print_lock:
+                    safe_print(f"{prefix} ⏭  {pkg_spec} already installed — skipping {cmd_name} install")
+                return {"version": version, "pkg": pkg_spec, "ok": True, "skipped": True,
+                        "returncode": 0, "elapsed_ms": elapsed, "stdout": "", "stderr": ""}
+
         with print_lock:
             safe_print(f"{prefix} ▶ {cmd_name} install {pkg_spec}")
 
-        t0 = time.perf_counter()
+        # Stream the merged output line by line as it arrives (the dispatcher
+        # debug output shows WHICH interpreter actually got targeted); only
+        # a bounded tail is kept for the result dict.
+        tail = collections.deque(maxlen=_INSTALL_TAIL_LINES)
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
                 shell=use_shell,
                 env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 encoding="utf-8",
                 errors="replace",
-                timeout=300,
+                bufsize=1,
             )
         except FileNotFoundError:
             elapsed = (time.perf_counter() - t0) * 1000
@@ -509,27 +999,37 @@ def main():
                 safe_print(f"{prefix}    PATH={env.get('PATH', '(not set)')}")
             return {"version": version, "pkg": pkg_spec, "ok": False,
                     "error": f"FileNotFoundError: {cmd_name}", "elapsed_ms": elapsed}
-        except subprocess.TimeoutExpired:
-            elapsed = (time.perf_counter() - t0) * 1000
+
+        # The watchdog flags the timeout before killing, so a kill that races
+        # a normal exit is still reported as a timeout, never as rc=-9.
+        timed_out = threading.Event()
+
+        def _on_timeout():
+            timed_out.set()
+            proc.kill()
+
+        watchdog = threading.Timer(_INSTALL_TIMEOUT, _on_timeout)
+        watchdog.daemon = True
+        watchdog.start()
+        with proc:
+            for line in proc.stdout:
+                tail.append(line)
+                with print_lock:
+                    safe_print(f"{prefix} [out   ] {line.rstrip()}")
+            returncode = proc.wait()
+        watchdog.cancel()
+
+        elapsed = (time.perf_counter() - t0) * 1000
+        if timed_out.is_set():
             with print_lock:
                 safe_print(f"{prefix} ❌ TIMEOUT after {format_duration(elapsed)}")
             return {"version": version, "pkg": pkg_spec, "ok": False,
                     "error": "TimeoutExpired", "elapsed_ms": elapsed}
 
-        elapsed = (time.perf_counter() - t0) * 1000
-        ok = result.returncode == 0
-
+        ok = returncode == 0
         with print_lock:
             status = "✅" if ok else "❌"
-            safe_print(f"{prefix} {status} rc={result.returncode}  time={format_duration(elapsed)}")
-            # Always show stdout/stderr — this is the dispatcher debug output
-            # showing WHICH interpreter actually got targeted
-            if result.stdout:
-                for line in result.stdout.splitlines():
-                    safe_print(f"{prefix} [stdout] {line}")
-            if result.stderr:
-                for line in result.stderr.splitlines():
-                    safe_print(f"{prefix} [stderr] {line}")
+            safe_print(f"{prefix} {status} rc={returncode}  time={format_duration(elapsed)}")
             if not ok:
                 safe_print(f"{prefix} ⚠️  Install failed — daemon phase will still run so we can see where it installs")
 
@@ -537,99 +1037,80 @@ def main():
             "version": version,
             "pkg": pkg_spec,
             "ok": ok,
-            "returncode": result.returncode,
+            "returncode": returncode,
             "elapsed_ms": elapsed,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
+            "stdout": "".join(tail),
+            "stderr": "",
         }
 
     # Run installs concurrently — one per Python version
     install_configs = [(v, f"rich=={r}") for v, r in test_configs]
-    install_results = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=len(install_configs)) as executor:
-        futs = {
-            executor.submit(_install_via_dispatcher, ver, pkg, i + 1): (ver, pkg)
-            for i, (ver, pkg) in enumerate(install_configs)
-        }
-        for fut in concurrent.futures.as_completed(futs):
-            install_results.append(fut.result())
+    install_results = _run_phase(
+        _install_via_dispatcher,
+        [(ver, pkg, i + 1) for i, (ver, pkg) in enumerate(install_configs)],
+    )
 
     # Summary
     safe_print("\n📦 Install summary:")
     for r in sorted(install_results, key=lambda x: x["version"]):
         status = "✅" if r["ok"] else "❌"
-        safe_print(f"   {status} Python {r['version']} — {r['pkg']}  ({format_duration(r['elapsed_ms'])})")
+        skipped = "  [already installed]" if r.get("skipped") else ""
+        safe_print(f"   {status} Python {r['version']} — {r['pkg']}  ({format_duration(r['elapsed_ms'])}){skipped}")
     all_installed = all(r["ok"] for r in install_results)
     if not all_installed:
         safe_print("\n⚠️  Some installs failed — continuing to warmup phase to capture behaviour")
 
-    # Phase 2: Cold run (first call = daemon worker spawn + import)
-    safe_print("\n🔥 Phase 2: Cold run — daemon worker spawn + first import (concurrent)")
-    safe_print("-" * 100)
-    warmup_results = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-        futures = {
-            executor.submit(warmup_worker, config, i + 1): config
-            for i, config in enumerate(test_configs)
-        }
-        for future in concurrent.futures.as_completed(futures):
-            result = future.result()
-            if result:
-                warmup_results.append(result)
-
-    if len(warmup_results) != len(test_configs):
-        safe_print("\n❌ Warmup failed — dumping full daemon log")
-        dump_daemon_log("DAEMON LOG AFTER WARMUP FAILURE")
-        sys.exit(1)
-
-    warmup_results.sort(key=lambda x: x["thread_id"])
-    safe_print("\n✅ All workers warmed up!")
-
-    # Phase 3: Warm run (worker already live, import already cached)
-    safe_print("\n⚡ Phase 3: Warm run — hot worker, import already cached (concurrent)")
-    safe_print("-" * 100)
-    benchmark_results = []
-    benchmark_start = time.perf_counter()
-    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-        futures = {
-            executor.submit(benchmark_execution, config, i + 1, warmup_results[i]): config
-            for i, config in enumerate(test_configs)
-        }
-        for future in concurrent.futures.as_completed(futures):
-            result = future.result()
-            if result:
-                benchmark_results.append(result)
+    if _BATCH_MODE:
+        # Phases 2-4 as one linked submission: warmup → bench (+verify) per config
+        safe_print("\n🔗 Phases 2-4: single linked batch (warmup → bench+verify per config)")
+        safe_print("-" * 100)
+        benchmark_results, verify_results = run_linked_batch(test_configs, interpreter_paths)
+        if len(benchmark_results) != len(test_configs):
+            safe_print("\n❌ Linked batch failed")
+            dump_daemon_log("DAEMON LOG AFTER BATCH FAILURE")
+            sys.exit(1)
+        print_benchmark_summary(benchmark_results, 0.0)
+    else:
+        # Phase 2: Cold run (first call = daemon worker spawn + import)
+        safe_print("\n🔥 Phase 2: Cold run — daemon worker spawn + first import (concurrent)")
+        safe_print("-" * 100)
+        warmup_results = asyncio.run(_warmup_phase_async(
+            [(config, i + 1, interpreter_paths[config[0]]) for i, config in enumerate(test_configs)]
+        ))
+
+        if len(warmup_results) != len(test_configs):
+            safe_print("\n❌ Warmup failed — dumping full daemon log")
+            dump_daemon_log("DAEMON LOG AFTER WARMUP FAILURE")
+            _abort(1)
+
+        warmup_results.sort(key=lambda x: x["thread_id"])
+        safe_print("\n✅ All workers warmed up!")
+
+        # Phase 3: Warm run (worker already live, import already cached)
+        safe_print("\n⚡ Phase 3: Warm run — hot worker, import already cached (concurrent)")
+        safe_print("-" * 100)
+        benchmark_start = time.perf_counter()
+        benchmark_results = _run_phase(
+            benchmark_execution,
+            [(config, i + 1, warmup_results[i], interpreter_paths[config[0]])
+             for i, config in enumerate(test_configs)],
+            fail_fast=True,
+        )
 
-    if len(benchmark_results) != len(test_configs):
-        safe_print("\n❌ Benchmark failed")
-        dump_daemon_log("DAEMON LOG AFTER BENCHMARK FAILURE")
-        sys.exit(1)
+        if len(benchmark_results) != len(test_configs):
+            safe_print("\n❌ Benchmark failed")
+            dump_daemon_log("DAEMON LOG AFTER BENCHMARK FAILURE")
+            _abort(1)
 
-    benchmark_total = (time.perf_counter() - benchmark_start) * 1000
-    print_benchmark_summary(benchmark_results, benchmark_total)
+        benchmark_total = (time.perf_counter() - benchmark_start) * 1000
+        benchmark_results.sort(key=lambda x: x["thread_id"])
+        print_benchmark_summary(benchmark_results, benchmark_total)
 
-    # Phase 4: Verification
-    safe_print("\n🔍 Phase 4: Verification (not timed)")
-    safe_print("-" * 100)
-    verify_results = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-        futures = {
-            executor.submit(verify_execution, config, i + 1): config
-            for i, config in enumerate(test_configs)
-        }
-        for future in concurrent.futures.as_completed(futures):
-            result = future.result()
-            if result:
-                verify_results.append(result)
+        # Phase 4: Verification — collected by the Phase 3 calls themselves
+        verify_results = [r["verify"] for r in benchmark_results]
 
     if len(verify_results) == len(test_configs):
-        safe_print("\n" + "=" * 100)
-        safe_print("🔍 VERIFICATION RESULTS")
-        safe_print("=" * 100)
-        for r in sorted(verify_results, key=lambda x: x["thread_id"]):
-            safe_print(f"  T{r['thread_id']}: Python {r['python_version']}  rich={r['rich_version']}")
-            safe_print(f"         exe : {r['python_path']}")
-            safe_print(f"         file: {r['rich_file']}")
+        print_verification_summary(verify_results)
 
     total_time = (time.perf_counter() - start_time) * 1000
     safe_print(f"\n🎉 DONE  total={format_duration(total_time)}")
@@ -641,7 +1122,6 @@ def main():
     # Shutdown daemon before exit so CI runner doesn't wait for orphaned children
     # (FS watcher watchdog threads, socket listeners, etc.)
     try:
-        from omnipkg.isolation.worker_daemon import cli_stop
         safe_print("\n==================================================")
         safe_print("🛑 PERFORMING ROBUST DAEMON TEARDOWN")
         safe_print("==================================================")
@@ -661,8 +1141,7 @@ def main():
     # os._exit bypasses atexit handlers and thread finalizers entirely.
     # sys.exit(0) goes through Python teardown which can hang if any background
     # thread (DaemonClient keepalive, watchdog observer, etc.) is still running.
-    import os
-    os._exit(0)
+    _os._exit(0)
 
 
 if __name__ == "__main__":
@@ -15,7 +15,6 @@ from pathlib import Path
 import socket
 import unittest
 import threading
-import requests
 import importlib.util
 from omnipkg.i18n import _
 
@@ -94,15 +93,18 @@ except ImportError:
             safe_print(_('  ✅ Port {} released and manager shut down.').format(self.port))
 
         def wait_for_ready(self, timeout=5.0):
-            start_time = time.time()
-            while time.time() - start_time < timeout:
+            deadline = time.monotonic() + timeout
+            backoff = 0.001
+            while time.monotonic() < deadline:
                 try:
                     with socket.create_connection(
-                        ("127.0.0.1", self.port), timeout=0.1
+                        ("127.0.0.1", self.port),
+                        timeout=max(0.001, deadline - time.monotonic()),
                     ):
                         return True
                 except (socket.timeout, ConnectionRefusedError):
-                    time.sleep(0.1)
+                    time.sleep(backoff)
+                    backoff = min(backoff * 10, 0.05)
             return False
 
     def patch_flask_code(code, interactive=False, validate_only=False):
@@ -132,6 +134,22 @@ except ImportError:
         return patched_code, port, manager
 
 
+def _http_get(port, path="/", timeout=5):
+    """One raw HTTP/1.0 GET; returns (status, body bytes)."""
+    with socket.create_connection(("127.0.0.1", port), timeout=timeout) as s:
+        s.sendall(
+            f"GET {path} HTTP/1.0\r\nHost: 127.0.0.1\r\nConnection: close\r\n\r\n".encode()
+        )
+        chunks = []
+        while True:
+            chunk = s.recv(4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    head, unused, body = b"".join(chunks).partition(b"\r\n\r\n")
+    return int(head.split()[1]), body
+
+
 class TestEnhancedFlaskPortFinder(unittest.TestCase):
     """
     A comprehensive test suite for the FlaskAppManager and its related utilities.
@@ -271,9 +289,9 @@ if __name__ == '__main__':
             )
             safe_print("  ✅ Server is ready and listening.")
             # FINAL VALIDATION PIECE: Confirm the app is responsive.
-            response = requests.get(f"http://127.0.0.1:{port}", timeout=5)
-            self.assertEqual(response.status_code, 200)
-            self.assertEqual(response.text, "Success!")
+            status, body = _http_get(port)
+            self.assertEqual(status, 200)
+            self.assertEqual(body, b"Success!")
             safe_print(
                 "  ✅ Final validation passed: Server is responsive and returns correct content."
             )
@@ -1,10 +1,10 @@
 import sys
-import time
 import socket
 import threading
 import unittest
-import requests
+import http.client
 import random
+from concurrent.futures import ThreadPoolExecutor
 from textwrap import dedent
 from pathlib import Path
 from omnipkg.i18n import _
@@ -28,6 +28,35 @@ except ImportError:
         safe_print,
     )
 
+def _probe(port, path='/', timeout=2):
+    """GET 127.0.0.1:port over http.client; no URL parsing, no requests import."""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=timeout)
+    try:
+        conn.request('GET', path)
+        return conn.getresponse().read().decode()
+    finally:
+        conn.close()
+
+# Dedented once at import; tests only substitute the port
+_CODE_A_TEMPLATE = dedent("""
+    from flask import Flask
+    app = Flask('app_a')
+    @app.route('/')
+    def idx(): return "I am App A (Incumbent)"
+    if __name__ == '__main__':
+        app.run(port={port})
+""")
+
+_CODE_B_TEMPLATE = dedent("""
+    from flask import Flask
+    app = Flask('app_b')
+    @app.route('/')
+    def idx(): return "I am App B (The Challenger)"
+    if __name__ == '__main__':
+        # INTENTIONAL CONFLICT:
+        app.run(port={port})
+""")
+
 def print_banner(title):
     safe_print(_('\n{}\n🎬 SCENARIO: {}\n{}').format('=' * 70, title, '=' * 70))
 
@@ -38,21 +67,23 @@ class TestFlaskPortFinderUltimate(unittest.TestCase):
     
     def setUp(self):
         self.managers = []
-        self.reserved_ports = []
+        self.reserved_ports = set()
 
     def tearDown(self):
         safe_print(_('\n   🧹 [Cleanup Phase]'))
-        for manager in self.managers:
+
+        def stop(manager):
             # We check if the manager has a process and is running before killing
-            if hasattr(manager, 'is_running') and manager.is_running:
+            if getattr(manager, 'is_running', False):
                 try:
                     manager.shutdown()
                 except Exception as e:
                     safe_print(_('      ⚠️ Warning during shutdown: {}').format(e))
-        
-        # Release ports safely
-        for port in self.reserved_ports:
-            release_port(port)
+
+        # Shutdowns (and port releases) are independent, so run them side by side
+        with ThreadPoolExecutor(max_workers=max(1, len(self.managers))) as pool:
+            list(pool.map(stop, self.managers))
+            list(pool.map(release_port, self.reserved_ports))
 
     def test_1_concurrent_stress_test(self):
         """
@@ -61,25 +92,18 @@ class TestFlaskPortFinderUltimate(unittest.TestCase):
         print_banner("The 'Matrix' Concurrency Test")
         print(_('   Goal: Prove 10 threads cannot accidentally grab the same port.'))
         
-        results = []
-        lock = threading.Lock()
-        
-        # Start high to avoid 5000/8080 conflicts
-        start_search = 8000
+        # Release all 10 threads at the same instant, so every one of them
+        # races through find_free_port's scan-and-reserve at once
+        barrier = threading.Barrier(10)
 
         def greedy_worker(thread_id):
-            p = find_free_port(start_port=start_search, reserve=True)
-            with lock:
-                results.append((thread_id, p))
-                self.reserved_ports.append(p)
-            time.sleep(0.01) 
+            barrier.wait()
+            return thread_id, find_free_port(reserve=True)
 
-        safe_print(_('   🚀 Launching 10 threads (Starting search at {})...').format(start_search))
-        threads = [threading.Thread(target=greedy_worker, args=(i,)) for i in range(10)]
-        for t in threads: t.start()
-        for t in threads: t.join()
-
-        results.sort(key=lambda x: x[1])
+        safe_print(_('   🚀 Launching 10 threads...'))
+        with ThreadPoolExecutor(max_workers=10) as ex:
+            results = sorted(ex.map(greedy_worker, range(10)), key=lambda x: x[1])
+        self.reserved_ports.update(port for unused, port in results)
 
         safe_print(_('\n   📊 Allocation Visualization:'))
         unique_ports = set()
@@ -102,24 +126,13 @@ class TestFlaskPortFinderUltimate(unittest.TestCase):
         # --- STEP 1: Find a random "Home" for App A ---
         random_start = random.randint(6000, 7000)
         port_a = find_free_port(start_port=random_start, reserve=True)
-        self.reserved_ports.append(port_a)
+        self.reserved_ports.add(port_a)
         
         safe_print(_("1️⃣  Phase 1: Establish the 'Incumbent' (App A)"))
         print(_('    Selected Arbitrary Port: {}').format(port_a))
         
-        code_a = dedent(f"""
-            from flask import Flask
-try:
-    from .common_utils import safe_print
-except ImportError:
-    from omnipkg.common_utils import safe_print
-            app = Flask('app_a')
-            @app.route('/')
-            def idx(): return "I am App A (Incumbent)"
-            if __name__ == '__main__':
-                app.run(port={port_a})
-        """)
-        
+        code_a = _CODE_A_TEMPLATE.format(port=port_a)
+
         # FIX: Removed 'interactive=True'. The class only needs code and port.
         manager_a = FlaskAppManager(code_a, port_a)
         self.managers.append(manager_a)
@@ -132,15 +145,7 @@ except ImportError:
         safe_print(_("\n2️⃣  Phase 2: The 'Intruder' (App B)"))
         print(_('    User script explicitly requests: app.run(port={})').format(port_a))
 
-        code_b = dedent(f"""
-            from flask import Flask
-            app = Flask('app_b')
-            @app.route('/')
-            def idx(): return "I am App B (The Challenger)"
-            if __name__ == '__main__':
-                # INTENTIONAL CONFLICT:
-                app.run(port={port_a}) 
-        """)
+        code_b = _CODE_B_TEMPLATE.format(port=port_a)
 
         # --- STEP 3: The Magic Patch ---
         safe_print(_('\n3️⃣  Phase 3: Omnipkg Intervention'))
@@ -148,7 +153,7 @@ except ImportError:
         # Here we DO use interactive=True because this is the helper function, not the class
         patched_code_b, port_b, manager_b = patch_flask_code(code_b, interactive=True)
         self.managers.append(manager_b)
-        self.reserved_ports.append(port_b)
+        self.reserved_ports.add(port_b)
 
         if port_b == port_a:
             self.fail("❌ Auto-patcher failed! It assigned the BUSY port.")
@@ -163,7 +168,7 @@ except ImportError:
 
         # Check App A
         try:
-            resp_a = requests.get(f"http://127.0.0.1:{port_a}", timeout=2).text
+            resp_a = _probe(port_a)
             safe_print(_('    ✅ App A (Port {}): {}').format(port_a, resp_a))
             self.assertIn("Incumbent", resp_a)
         except Exception as e:
@@ -171,7 +176,7 @@ except ImportError:
 
         # Check App B
         try:
-            resp_b = requests.get(f"http://127.0.0.1:{port_b}", timeout=2).text
+            resp_b = _probe(port_b)
             safe_print(_('    ✅ App B (Port {}): {}').format(port_b, resp_b))
             self.assertIn("Challenger", resp_b)
         except Exception as e:
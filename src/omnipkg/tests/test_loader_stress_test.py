@@ -7,20 +7,17 @@ Now using the REAL worker daemon for maximum parallelism!
 """
 import sys
 import os
+import json
 import subprocess
 import time
 import random
 import threading
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 from omnipkg.i18n import _
 
-# Import the daemon client
-try:
-    from omnipkg.loader import omnipkgLoader
-    from omnipkg.isolation.worker_daemon import DaemonClient
-except ImportError:
-    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 """
 🌀 OMNIPKG CHAOS THEORY 🌀
 The most UNHINGED dependency isolation stress test ever conceived.
@@ -42,6 +39,9 @@ try:
     from omnipkg.isolation.runners import run_python_code_in_isolation
     from omnipkg.isolation.workers import PersistentWorker
     from omnipkg.isolation.switchers import TrueSwitcher
+
+    # 4. The Daemon Client
+    from omnipkg.isolation.worker_daemon import DaemonClient
 except ImportError:
     # Fallback for running directly without package installed
     sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
@@ -49,6 +49,8 @@ except ImportError:
     from omnipkg.loader import omnipkgLoader
     from omnipkg.isolation.runners import run_python_code_in_isolation
     from omnipkg.isolation.workers import PersistentWorker
+    from omnipkg.isolation.switchers import TrueSwitcher
+    from omnipkg.isolation.worker_daemon import DaemonClient
 
 #  env vars globally for this process too
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
@@ -56,12 +58,13 @@ os.environ["TF_ENABLE_ONEDNN_OPTS"] = "0"
 
 
 # HELPER: Check verbosity
-def is_verbose_mode():
-    return (
-        "--verbose" in sys.argv
-        or "-v" in sys.argv
-        or os.environ.get("OMNIPKG_VERBOSE") == "1"
-    )
+# Evaluated once at import: argv and the environment don't change mid-run
+# (the CLI exports OMNIPKG_VERBOSE before it launches this file).
+VERBOSE = (
+    "--verbose" in sys.argv
+    or "-v" in sys.argv
+    or os.environ.get("OMNIPKG_VERBOSE") == "1"
+)
 
 
 # ASCII art madness
@@ -140,6 +143,33 @@ def ensure_daemon_running(warmup_specs=None, timeout: float = 30.0) -> bool:
         return False
 
 
+# One DaemonClient shared by the chaos tests. The first caller confirms the
+# daemon answers (starting it if needed); later callers skip the status
+# round-trip entirely.
+_DAEMON_CLIENT = None
+_DAEMON_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client(warmup_specs=None):
+    """
+    Return the shared DaemonClient, or None if the daemon can't be reached.
+    warmup_specs is passed to ensure_daemon_running() if it has to start it.
+    """
+    global _DAEMON_CLIENT
+    if _DAEMON_CLIENT is None:
+        with _DAEMON_CLIENT_LOCK:
+            if _DAEMON_CLIENT is None:
+                from omnipkg.isolation.worker_daemon import DaemonClient
+
+                client = DaemonClient()
+                if not client.status().get("success"):
+                    safe_print(" ❌ Daemon not running! Starting...")
+                    if not ensure_daemon_running(warmup_specs=warmup_specs):
+                        return None
+                _DAEMON_CLIENT = client
+    return _DAEMON_CLIENT
+
+
 def chaos_test_1_version_tornado():
     """🌪️ TEST 1: VERSION TORNADO - Compare Legacy vs Daemon WITH WARMUP"""
     safe_print("╔══════════════════════════════════════════════════════════════╗")
@@ -148,6 +178,7 @@ def chaos_test_1_version_tornado():
     safe_print("╚══════════════════════════════════════════════════════════════╝\n")
 
     versions = ["1.24.3", "1.26.4", "2.3.5"]
+    directions = ["↗️", "↘️", "↔️", "↕️"]
     
     # ==================================================================
     # PHASE 0: DAEMON WARMUP (CRITICAL!)
@@ -158,10 +189,12 @@ def chaos_test_1_version_tornado():
     daemon_warmup_times = {}
     
     try:
-        from omnipkg.isolation.worker_daemon import DaemonClient, DaemonProxy
+        from omnipkg.isolation.worker_daemon import DaemonProxy
         
         safe_print("   ⚡ Initializing DaemonClient...")
-        client = DaemonClient()
+        client = _get_client()
+        if client is None:
+            return False
         
         # Warm up EACH version before timing
         for ver in versions:
@@ -207,9 +240,9 @@ print(f"WARMED:{np.__version__}")
     legacy_times = []
     legacy_success = 0
 
-    for i in range(10):  # 10 random switches
-        ver = random.choice(versions)
-        direction = random.choice(["↗️", "↘️", "↔️", "↕️"])
+    # 10 random switches, drawn in one call each
+    picks = zip(random.choices(versions, k=10), random.choices(directions, k=10))
+    for i, (ver, direction) in enumerate(picks):
 
         try:
             start = time.perf_counter()
@@ -229,8 +262,6 @@ print(f"WARMED:{np.__version__}")
         except Exception as e:
             safe_print(f"   💥 Legacy #{i+1:02d}: numpy {ver} → FAILED: {str(e)[:50]}")
 
-        time.sleep(0.02)
-
     # ==================================================================
     # PHASE 2: Daemon Mode (AFTER WARMUP - FAIR COMPARISON!)
     # ==================================================================
@@ -240,39 +271,35 @@ print(f"WARMED:{np.__version__}")
     daemon_times = []
     daemon_success = 0
 
-    for i in range(10):  # Same 10 random switches
-        ver = random.choice(versions)
-        direction = random.choice(["↗️", "↘️", "↔️", "↕️"])
+    # Same 10 random switches
+    picks = zip(random.choices(versions, k=10), random.choices(directions, k=10))
+    for i, (ver, direction) in enumerate(picks):
         
         pkg_spec = f"numpy=={ver}"
 
         try:
             start = time.perf_counter()
-            
-            # Use DaemonProxy (workers are already warm!)
-            proxy = DaemonProxy(client, pkg_spec)
 
-            # Execute numpy code
+            # The worker merges a `result` dict into its response, so the
+            # version and sum come back as fields (workers are already warm!)
+            # instead of a printed line to split and parse.
             code = """
 import numpy as np
 arr = np.random.rand(50, 50)
-result = np.sum(arr)
-print(f"{np.__version__}|{result}")
+result = {"numpy_version": np.__version__, "sum": float(np.sum(arr))}
 """
-            result = proxy.execute(code)
+            result = client.execute_shm(pkg_spec, code, {}, {})
             elapsed = (time.perf_counter() - start) * 1000
 
-            if result["success"]:
-                output = result["stdout"].strip()
-                if "|" in output:
-                    actual_ver, sum_str = output.split("|")
+            if result.get("success"):
+                if "sum" in result:
                     daemon_times.append(elapsed)
                     daemon_success += 1
                     safe_print(
-                        f"   {direction} Daemon #{i+1:02d}: numpy {ver} → sum={sum_str} ({elapsed:.2f}ms)"
+                        f"   {direction} Daemon #{i+1:02d}: numpy {result['numpy_version']} → sum={result['sum']:.2f} ({elapsed:.2f}ms)"
                     )
                 else:
-                    safe_print(f"   💥 Daemon #{i+1:02d}: Bad output: {output}")
+                    safe_print(f"   💥 Daemon #{i+1:02d}: No result in response: {result.get('stdout', '').strip()}")
             else:
                 safe_print(
                     f"   💥 Daemon #{i+1:02d}: Execution failed: {result.get('error', 'Unknown')}"
@@ -281,8 +308,6 @@ print(f"{np.__version__}|{result}")
         except Exception as e:
             safe_print(f"   💥 Daemon #{i+1:02d}: Exception: {str(e)[:50]}")
 
-        time.sleep(0.02)
-
     # ==================================================================
     # COMPARISON RESULTS (FAIR COMPARISON!)
     # ==================================================================
@@ -335,8 +360,7 @@ print(f"{np.__version__}|{result}")
     
     rapid_times = []
     
-    for i in range(100):
-        ver = random.choice(versions)
+    for i, ver in enumerate(random.choices(versions, k=100)):
         pkg_spec = f"numpy=={ver}"
         
         try:
@@ -403,7 +427,7 @@ def chaos_test_2_dependency_inception():
 
     versions = ["1.24.3", "1.26.4", "2.3.5"]
     MAX_DEPTH = 10
-    verbose = is_verbose_mode()
+    verbose = VERBOSE
 
     # ==================================================================
     # PHASE 1: Legacy omnipkgLoader (Local Process)
@@ -424,47 +448,46 @@ def chaos_test_2_dependency_inception():
     start_legacy = time.perf_counter()
     abi_misses = 0
 
-    def go_deeper_legacy(level):
+    def go_deeper_legacy():
         nonlocal depth_legacy, abi_misses
-        if level > MAX_DEPTH:
-            return
-
-        indent = "  " * level
-        ver = random.choice(versions)
+        # One ExitStack holds every level's loader, so the nesting is a flat
+        # loop instead of MAX_DEPTH recursive frames; levels still unwind in
+        # reverse order when the stack closes.
+        with ExitStack() as stack:
+            picks = random.choices(versions, k=MAX_DEPTH)
+            for level, ver in enumerate(picks, start=1):
+                indent = "  " * level
 
-        safe_print(_('   {}{} Level {}: numpy {}').format(indent, '🔻' * level, level, ver))
+                safe_print(_('   {}{} Level {}: numpy {}').format(indent, '🔻' * level, level, ver))
 
-        with omnipkgLoader(f"numpy=={ver}", worker_fallback=True) as loader:
-            try:
-                if loader._worker_mode:
-                    result = loader.execute(
-                        "import numpy as np\nimport sys\nsys.stdout.write(np.__version__)"
-                    )
-                    got = result.get("stdout", "").strip() or "⚠️ no output"
-                else:
-                    import numpy as np
-                    got = np.__version__
-            # Import may fail or return wrong version if a cross-ABI switch
-            # encountered a .so mapping conflict. Catch and continue — this
-            # is the known limitation we are demonstrating.
-            except Exception as e:
-                abi_misses += 1
-                got = f"⚠️ import failed ({type(e).__name__}: {str(e)})"
+                loader = stack.enter_context(omnipkgLoader(f"numpy=={ver}", worker_fallback=True))
+                try:
+                    if loader._worker_mode:
+                        result = loader.execute(
+                            "import numpy as np\nimport sys\nsys.stdout.write(np.__version__)"
+                        )
+                        got = result.get("stdout", "").strip() or "⚠️ no output"
+                    else:
+                        import numpy as np
+                        got = np.__version__
+                # Import may fail or return wrong version if a cross-ABI switch
+                # encountered a .so mapping conflict. Catch and continue — this
+                # is the known limitation we are demonstrating.
+                except Exception as e:
+                    abi_misses += 1
+                    got = f"⚠️ import failed ({type(e).__name__}: {str(e)})"
 
-            if got != ver and not got.startswith("⚠️"):
-                safe_print(_('   ↕️  Version drift: requested {} got {} (mapped .so constraint)').format(ver, got))
-            elif got.startswith("⚠️"):
-                safe_print(f'   💥 {got}')
+                if got != ver and not got.startswith("⚠️"):
+                    safe_print(_('   ↕️  Version drift: requested {} got {} (mapped .so constraint)').format(ver, got))
+                elif got.startswith("⚠️"):
+                    safe_print(f'   💥 {got}')
 
-            depth_legacy = max(depth_legacy, level)
+                depth_legacy = max(depth_legacy, level)
 
-            if level < MAX_DEPTH:
-                go_deeper_legacy(level + 1)
-            else:
-                safe_print(_('   {}{} REACHED THE CORE!').format(indent, '💥' * 10))
+            safe_print(_('   {}{} REACHED THE CORE!').format("  " * MAX_DEPTH, '💥' * 10))
 
     try:
-        go_deeper_legacy(1)
+        go_deeper_legacy()
     except Exception as e:
         safe_print(_('   ❌ Legacy Phase Failed: {}').format(e))
 
@@ -501,6 +524,7 @@ def chaos_test_2_dependency_inception():
 
     remote_code = f"""
 import sys, os, random
+from contextlib import ExitStack
 from omnipkg.loader import omnipkgLoader
 
 # DEBUG: verify env var
@@ -512,25 +536,18 @@ depth = 0
 MAX_DEPTH = {MAX_DEPTH}
 versions = {versions}
 
-def go_deeper(level):
-    global depth
-    if level > MAX_DEPTH: return
-    ver = random.choice(versions)
-    # DEBUG: log isolation mode
-    loader = omnipkgLoader(f"numpy=={{ver}}", quiet=True, 
-                           isolation_mode='overlay', worker_fallback=False)
-    sys.stdout.write(f"BEFORE_ENTER level={{level}} ver={{ver}} "
-                     f"isolation={{loader.isolation_mode}} "
-                     f"in_daemon={{os.environ.get('OMNIPKG_IS_DAEMON_WORKER')}}\\n")
-    sys.stdout.flush()
-    with loader:
+with ExitStack() as stack:
+    for level, ver in enumerate(random.choices(versions, k=MAX_DEPTH), start=1):
+        # DEBUG: log isolation mode
+        loader = omnipkgLoader(f"numpy=={{ver}}", quiet=True, 
+                               isolation_mode='overlay', worker_fallback=False)
+        sys.stdout.write(f"BEFORE_ENTER level={{level}} ver={{ver}} "
+                         f"isolation={{loader.isolation_mode}} "
+                         f"in_daemon={{os.environ.get('OMNIPKG_IS_DAEMON_WORKER')}}\\n")
+        sys.stdout.flush()
+        stack.enter_context(loader)
         depth = max(depth, level)
-        if level < MAX_DEPTH:
-            go_deeper(level + 1)
-        else:
-            sys.stdout.write("CORE_REACHED\\n")
-
-go_deeper(1)
+    sys.stdout.write("CORE_REACHED\\n")
 """
     try:
         proxy = DaemonProxy(client, "numpy==1.26.4", python_exe=sys.executable)
@@ -595,37 +612,37 @@ def chaos_test_3_framework_battle_royale():
     safe_print("║  All 4 frameworks executing AT THE SAME EXACT TIME          ║")
     safe_print("╚══════════════════════════════════════════════════════════════╝\n")
 
-    # 1. Connect to Daemon and measure startup
+    # Pre-warm the combatants. If the daemon has to be started, that runs on
+    # a background thread while the fighters are set up below; we only wait
+    # for it right before connecting.
+    vip_specs = [
+        "tensorflow==2.13.0",
+        "torch==2.0.1+cu118",
+        "numpy==1.24.3",
+        "numpy==2.3.5",
+    ]
+    daemon_ready = threading.Event()
+    daemon_up = {"ok": True}
     try:
-        from omnipkg.isolation.worker_daemon import DaemonClient
         from concurrent.futures import as_completed
         import numpy as np
+        from omnipkg.isolation.worker_daemon import DaemonClient
 
-        daemon_start = time.perf_counter()
-        client = DaemonClient()
-        status = client.status()
-        daemon_connect_time = (time.perf_counter() - daemon_start) * 1000
-
-        if not status.get("success"):
+        if DaemonClient().status().get("success"):
+            daemon_ready.set()
+        else:
             safe_print("   ⚙️  Summoning the Arena (Daemon)...")
-            vip_specs = [
-                "tensorflow==2.13.0",
-                "torch==2.0.1+cu118",
-                "numpy==1.24.3",
-                "numpy==2.3.5",
-            ]
-            if not ensure_daemon_running(warmup_specs=vip_specs):
-                return False
-            daemon_start = time.perf_counter()
-            client = DaemonClient()
-            daemon_connect_time = (time.perf_counter() - daemon_start) * 1000
 
-        safe_print(f"⚡ Daemon connection established in {daemon_connect_time:.2f}ms\n")
+            def summon():
+                daemon_up["ok"] = ensure_daemon_running(warmup_specs=vip_specs)
+                daemon_ready.set()
+
+            threading.Thread(target=summon, daemon=True).start()
 
     except ImportError:
         return False
 
-    # 2. Define The Fighters
+    # 1. Define The Fighters
     combatants = [
         (
             "TensorFlow",
@@ -655,6 +672,20 @@ def chaos_test_3_framework_battle_royale():
         duration = (time.perf_counter() - t_start) * 1000
         return (name, res, duration)
 
+    # 2. Connect to Daemon and measure startup. ensure_daemon_running()
+    # returns once the daemon answers, and each fighter's call waits for its
+    # own worker, so no fixed boot delay is needed.
+    daemon_ready.wait()
+    if not daemon_up["ok"]:
+        return False
+    daemon_start = time.perf_counter()
+    client = _get_client(warmup_specs=vip_specs)
+    if client is None:
+        return False
+    daemon_connect_time = (time.perf_counter() - daemon_start) * 1000
+
+    safe_print(f"⚡ Daemon connection established in {daemon_connect_time:.2f}ms\n")
+
     safe_print("🥊 ROUND 1: Truly Concurrent Execution\n")
 
     wall_clock_start = time.perf_counter()
@@ -706,28 +737,8 @@ def chaos_test_3_framework_battle_royale():
     safe_print("║  TensorFlow, PyTorch, JAX, NumPy - ALL IN MEMORY AT ONCE     ║")
     safe_print("╚══════════════════════════════════════════════════════════════╝\n")
 
-    # 1. Connect to Daemon
-    try:
-        from omnipkg.isolation.worker_daemon import DaemonClient
-
-        client = DaemonClient()
-        if not client.status().get("success"):
-            safe_print("   ⚙️  Summoning the Arena (Daemon)...")
-            # Pre-warm the combatants
-            vip_specs = [
-                "tensorflow==2.13.0",
-                "torch==2.0.1+cu118",
-                "numpy==1.24.3",
-                "numpy==2.3.5",
-            ]
-            if not ensure_daemon_running(warmup_specs=vip_specs):
-                return False
-            time.sleep(3)  # Give TF time to boot (it's heavy)
-
-    except ImportError:
-        return False
-
-    # 2. Define The Fighters
+    # The daemon and client from ROUND 1 are reused.
+    # Define The Fighters
     combatants = [
         {
             "name": "TensorFlow",
@@ -755,16 +766,23 @@ def chaos_test_3_framework_battle_royale():
 
     total_start = time.perf_counter()
 
-    # We will launch them sequentially to see the latency,
-    # but the daemon keeps them all resident in RAM.
-
-    for fighter in combatants:
-        t_start = time.perf_counter()
-
-        # Smart Execute (Data is None, so it uses JSON path automatically)
-        res = client.execute_smart(fighter["spec"], fighter["code"])
+    # Each fighter hits a different resident worker, so fire all of them
+    # at once and gather; the round takes as long as the slowest fighter.
+    # Smart Execute (Data is None, so it uses JSON path automatically)
+    # Each duration is stamped as its own future completes, so a fast
+    # fighter is not charged for a slower one gathered ahead of it.
+    t_start = time.perf_counter()
+    futs = {
+        client.execute_smart_async(fighter["spec"], fighter["code"]): fighter
+        for fighter in combatants
+    }
+    durations = {}
+    for fut in as_completed(futs):
+        durations[fut] = (time.perf_counter() - t_start) * 1000
 
-        duration = (time.perf_counter() - t_start) * 1000
+    for fut, fighter in futs.items():
+        res = fut.result()
+        duration = durations[fut]
 
         if res.get("success"):
             output = res["result"].strip()
@@ -783,8 +801,7 @@ def chaos_test_3_framework_battle_royale():
     # ---------------------------------------------------------
     safe_print("🥊 ROUND 3: Smart Data Hand-off (1MB Array)\n")
 
-    import numpy as np
-
+    # np is already bound by the import at the top of this test.
     data = np.ones(1024 * 128)  # 1MB of floats (128K * 8 bytes)
 
     # TF Sum via Smart Client
@@ -922,21 +939,49 @@ def chaos_test_4_memory_madness():
     allocations = []
     versions = ["1.24.3", "1.26.4", "2.3.5"]
 
+    # Each allocation happens inside the daemon's persistent worker for that
+    # numpy version, so the memory lives (and is reclaimed) there instead of
+    # piling up in this process. Without a daemon, fall back to the loader.
+    # Only nbytes, the buffer address and the worker pid are reported, so
+    # np.empty skips the fill pass np.ones would make over every page.
+    client = _get_client()
+
+    alloc_code = """
+import json
+import os
+import numpy as np
+arr = np.empty(({n}, {n}))
+print(json.dumps([arr.nbytes, arr.ctypes.data, os.getpid()]))
+del arr
+"""
+
     for i, ver in enumerate(versions):
-        with omnipkgLoader(f"numpy=={ver}"):
-            import numpy as np
+        # Allocate increasingly large arrays
+        n = 1000 * (i + 1)
+        if client is not None:
+            res = client.execute_smart(f"numpy=={ver}", alloc_code.format(n=n))
+            if not res.get("success"):
+                safe_print(_('💥 numpy {}: allocation failed: {}').format(ver, res.get('error')))
+                continue
+            nbytes, addr, pid = json.loads(res["result"].strip().splitlines()[-1])
+        else:
+            with omnipkgLoader(f"numpy=={ver}"):
+                import numpy as np
 
-            # Allocate increasingly large arrays
-            size = (1000 * (i + 1), 1000 * (i + 1))
-            arr = np.ones(size)
-            mem_mb = arr.nbytes / 1024 / 1024
-            addr = hex(id(arr))
+                arr = np.empty((n, n))
+                nbytes, addr, pid = arr.nbytes, arr.ctypes.data, os.getpid()
+                del arr
 
-            allocations.append((ver, mem_mb, addr))
-            safe_print(f"🧠 numpy {ver}: Allocated {mem_mb:.1f}MB at {addr}")
+        mem_mb = nbytes / 1024 / 1024
+
+        # Keep the raw buffer address; it is only rendered as hex when printed.
+        allocations.append((ver, mem_mb, pid, addr))
+        safe_print(f"🧠 numpy {ver}: Allocated {mem_mb:.1f}MB at {addr:#x} (pid {pid})")
 
     safe_print(_('\n🎯 Total allocations: {}').format(len(allocations)))
-    safe_print(_('🎯 Unique memory addresses: {}').format(len({a[2] for a in allocations})))
+    # An address only means something within its own process, so count
+    # distinct (pid, address) pairs rather than bare addresses.
+    safe_print(_('🎯 Distinct (worker pid, address) buffers: {}').format(len({a[2:] for a in allocations})))
     safe_print("✅ MEMORY CHAOS CONTAINED!\n")
 
 def chaos_test_5_race_condition_roulette():
@@ -947,12 +992,28 @@ def chaos_test_5_race_condition_roulette():
     safe_print("╚══════════════════════════════════════════════════════════════╝\n")
 
     import numpy as np
-    from omnipkg.isolation.worker_daemon import DaemonClient
 
     results = {}
     versions = ["numpy==1.24.3", "numpy==1.26.4", "numpy==2.3.5"]
-    print_lock = threading.Lock()
-    verbose = is_verbose_mode()  # assuming this function exists in your codebase
+    # Workers append log lines to a deque (atomic under the GIL) and one
+    # printer thread drains it, so no worker ever waits on a print lock.
+    log_q = deque()
+    log_event = threading.Event()
+    log_done = threading.Event()
+
+    def log_printer():
+        while True:
+            log_event.wait()
+            log_event.clear()
+            while log_q:
+                safe_print(log_q.popleft())
+            if log_done.is_set() and not log_q:
+                return
+
+    def log(msg):
+        log_q.append(msg)
+        log_event.set()
+    verbose = VERBOSE
 
         # ──────────────────────────────────────────────────────────────
     # PHASE 0: Warm-up – one execution per version to hot-start workers
@@ -960,12 +1021,13 @@ def chaos_test_5_race_condition_roulette():
     # so LAPACK/BLAS are NOT initialized, keeping warmup fast.
     # ──────────────────────────────────────────────────────────────
     safe_print("🔥 Performing controlled warm-up for each version...")
-    client = DaemonClient()
-    if not client.status().get("success"):
-        safe_print(" ❌ Daemon not running! Starting...")
-        if not ensure_daemon_running():
-            return False
+    client = _get_client()
+    if client is None:
+        return False
     warmup_data = np.random.rand(500, 500).astype(np.float64)  # same size as benchmark
+    # One pair of SHM segments serves every warm-up call
+    warm_in = client.alloc_shm_buffer(warmup_data.shape, warmup_data.dtype)
+    warm_out = client.alloc_shm_buffer((2,), "float64")
     for spec in versions:
         t_start = time.perf_counter()
         try:
@@ -982,24 +1044,29 @@ print(np.__version__)
                 input_array=warmup_data,
                 output_shape=(2,),
                 output_dtype="float64",
+                input_buffer=warm_in,
+                output_buffer=warm_out,
             )
             duration = (time.perf_counter() - t_start) * 1000
             safe_print(f"  ✅ Warm-up {spec} complete in {duration:>6.2f} ms")
         except Exception as e:
             safe_print(f"  ⚠️ Warm-up failed for {spec}: {e}")
+            warm_in.close()
+            warm_out.close()
             return False
+    warm_in.close()
+    warm_out.close()
 
     # ──────────────────────────────────────────────────────────────
     # PHASE 1: Chaos – 10 threads × 3 swaps each
     # ──────────────────────────────────────────────────────────────
     def chaotic_worker(thread_id):
-        thread_versions = [random.choice(versions) for unused_ in range(3)]
+        thread_versions = random.choices(versions, k=3)
         thread_results = []
-        for i, spec in enumerate(thread_versions):
-            # Smaller matrix to avoid thermal death
-            local_data = np.random.rand(500, 500)  # ~2 MB, still meaningful
+        # Smaller matrices to avoid thermal death
+        local_datas = np.random.rand(len(thread_versions), 500, 500)  # ~2 MB each, still meaningful
 
-            code = """
+        code = """
 import os
 os.environ["OMP_NUM_THREADS"] = "1"
 os.environ["OPENBLAS_NUM_THREADS"] = "1"
@@ -1013,55 +1080,70 @@ mean_val = np.mean(arr_in)
 arr_out[0] = sum_val
 arr_out[1] = mean_val
 print(np.__version__)
-            """
-
-            t_start = time.perf_counter()
-            try:
-                result_arr, response = client.execute_zero_copy(
-                    spec,
-                    code,
-                    input_array=local_data,
-                    output_shape=(2,),
-                    output_dtype="float64",
-                )
-                t_end = time.perf_counter()
-                duration_ms = (t_end - t_start) * 1000
+        """
 
-                local_sum = np.sum(local_data)
-                local_mean = np.mean(local_data)
-                remote_sum, remote_mean = result_arr[0], result_arr[1]
-                remote_version = response["stdout"].strip()
-
-                if np.isclose(local_sum, remote_sum, rtol=1e-6) and np.isclose(local_mean, remote_mean, rtol=1e-6):
-                    status = "✅"
-                    msg = f"{remote_version:<14}"
-                else:
-                    status = "❌"
-                    msg = _('MATH ERROR: sum {} vs {} | mean {} vs {}').format(local_sum, remote_sum, local_mean, remote_mean)
+        # All three swaps go to the daemon in one round-trip, through SHM
+        # segments this thread allocates once up front
+        buffers = [
+            (client.alloc_shm_buffer(d.shape, d.dtype), client.alloc_shm_buffer((2,), "float64"))
+            for d in local_datas
+        ]
+        try:
+            batch = client.execute_zero_copy_batch(
+                thread_versions,
+                [code] * len(thread_versions),
+                local_datas,
+                [(2,)] * len(thread_versions),
+                output_dtype="float64",
+                buffers=buffers,
+            )
+        except Exception as e:
+            results[thread_id] = [(spec, str(e), "❌", 0) for spec in thread_versions]
+            log(f" 💥 Thread {thread_id:02d}: {e}")
+            return
+        finally:
+            for shm_in, shm_out in buffers:
+                shm_in.close()
+                shm_out.close()
+
+        # Every local check in one vectorized pass over the (3, 500, 500) block
+        local_sums = local_datas.sum(axis=(1, 2))
+        local_means = local_datas.mean(axis=(1, 2))
+        for i, (spec, (result_arr, response)) in enumerate(zip(thread_versions, batch)):
+            duration_ms = response.get("elapsed_ms", 0.0)
+            local_sum, local_mean = local_sums[i], local_means[i]
+            remote_sum, remote_mean = result_arr[0], result_arr[1]
+            remote_version = response["stdout"].strip()
+
+            if np.isclose(local_sum, remote_sum, rtol=1e-6) and np.isclose(local_mean, remote_mean, rtol=1e-6):
+                status = "✅"
+                msg = f"{remote_version:<14}"
+            else:
+                status = "❌"
+                msg = _('MATH ERROR: sum {} vs {} | mean {} vs {}').format(local_sum, remote_sum, local_mean, remote_mean)
 
-                thread_results.append((spec, remote_version, status, duration_ms))
+            thread_results.append((spec, remote_version, status, duration_ms))
 
-                if verbose:
-                    with print_lock:
-                        safe_print(
-                            f" 🎲 Thread {thread_id:02d} Round {i+1}: {msg} → {duration_ms:>6.2f} ms"
-                        )
-            except Exception as e:
-                thread_results.append((spec, str(e), "❌", 0))
-                with print_lock:
-                    safe_print(f" 💥 Thread {thread_id:02d}: {e}")
+            if verbose:
+                log(f" 🎲 Thread {thread_id:02d} Round {i+1}: {msg} → {duration_ms:>6.2f} ms")
 
         results[thread_id] = thread_results
 
     safe_print("🔥 Launching 10 concurrent threads hammering SHM subsystem (500×500 matrices)...")
+    printer = threading.Thread(target=log_printer, daemon=True)
+    printer.start()
     race_start = time.perf_counter()
 
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(chaotic_worker, i) for i in range(10)]
-        for f in futures:
-            f.result()
-
-    race_time = time.perf_counter() - race_start
+    try:
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [executor.submit(chaotic_worker, i) for i in range(10)]
+            for f in futures:
+                f.result()
+    finally:
+        race_time = time.perf_counter() - race_start
+        log_done.set()
+        log_event.set()
+        printer.join()
 
     total_swaps = 0
     successful_swaps = 0
@@ -1170,22 +1252,22 @@ def chaos_test_8_quantum_superposition():
         import numpy as np1
 
         state1 = np1.array([1, 2, 3])
-        states.append(("1.24.3", hex(id(state1))))
-        safe_print(_('   |ψ₁⟩ numpy 1.24.3 exists at {}').format(hex(id(state1))))
+        states.append(("1.24.3", id(state1)))
+        safe_print(_('   |ψ₁⟩ numpy 1.24.3 exists at {}').format(format(states[-1][1], '#x')))
 
         with omnipkgLoader("numpy==1.26.4"):
             import numpy as np2
 
             state2 = np2.array([4, 5, 6])
-            states.append(("1.26.4", hex(id(state2))))
-            safe_print(_('   |ψ₂⟩ numpy 1.26.4 exists at {}').format(hex(id(state2))))
+            states.append(("1.26.4", id(state2)))
+            safe_print(_('   |ψ₂⟩ numpy 1.26.4 exists at {}').format(format(states[-1][1], '#x')))
 
             with omnipkgLoader("numpy==2.3.5"):
                 import numpy as np3
 
                 state3 = np3.array([7, 8, 9])
-                states.append(("2.3.5", hex(id(state3))))
-                safe_print(_('   |ψ₃⟩ numpy 2.3.5 exists at {}').format(hex(id(state3))))
+                states.append(("2.3.5", id(state3)))
+                safe_print(_('   |ψ₃⟩ numpy 2.3.5 exists at {}').format(format(states[-1][1], '#x')))
 
                 safe_print("\n   💫 QUANTUM SUPERPOSITION ACHIEVED!")
                 safe_print(_('   💫 {} states exist simultaneously!').format(len(states)))
@@ -1205,7 +1287,7 @@ def chaos_test_9_import_hell():
     # --- MODIFIED: Use PersistentWorker for TensorFlow ---
     safe_print("   😈 Circle 1: TensorFlow Reality (Persistent Worker)")
 
-    verbose = is_verbose_mode()  # <--- Check verbosity
+    verbose = VERBOSE
     tf_worker = PersistentWorker(
         "tensorflow==2.13.0", verbose=verbose
     )  # <--- Pass it here
@@ -1343,7 +1425,7 @@ def chaos_test_11_tensorflow_resurrection():
     safe_print("╔══════════════════════════════════════════════════════════════╗")
     safe_print("║  TEST 11: ⚰️💀⚡ TENSORFLOW RESURRECTION ULTIMATE          ║")
     safe_print("╚══════════════════════════════════════════════════════════════╝\n")
-    verbose = is_verbose_mode()
+    verbose = VERBOSE
 
     SITE_PKGS = Path("/home/minds3t/miniforge3/envs/evocoder_env/lib/python3.11/site-packages")
     MV_BASE = SITE_PKGS / ".omnipkg_versions"
@@ -1773,7 +1855,7 @@ with omnipkgLoader("{config['lightning']}"):
                 pass
 
     successful = 0
-    verbose = is_verbose_mode()
+    verbose = VERBOSE
 
     # Timing tracking
     total_start = time.perf_counter()
@@ -1972,7 +2054,7 @@ def chaos_test_14_circular_dependency_hell():
     safe_print("║  NOW POWERED BY PERSISTENT WORKERS FOR TRUE ISOLATION!       ║")
     safe_print("╚══════════════════════════════════════════════════════════════╝\n")
 
-    verbose = is_verbose_mode()
+    verbose = VERBOSE
     safe_print("🌀 Creating circular dependency nightmare...\n")
 
     # ═══════════════════════════════════════════════════════════════
@@ -2440,7 +2522,7 @@ def chaos_test_16_nested_reality_hell():
     safe_print("║  Phase 1: Multi-Process Switching | Phase 2: Deep Nesting    ║")
     safe_print("╚══════════════════════════════════════════════════════════════╝\n")
 
-    verbose = is_verbose_mode()
+    verbose = VERBOSE
 
     # ═════════════════════════════════════════════════════════════
     # PHASE 1: Rapid Sequential NumPy Switching (Using omnipkgLoader)
@@ -0,0 +1,159 @@
+"""
+Persistent Flask runner used by FlaskAppManager's runner pool.
+
+Started once as ``python -m omnipkg.utils._flask_runner`` and reused for many
+apps, so the interpreter start-up is paid once rather than per app. Requests
+arrive on stdin as pickled dicts:
+
+    {"op": "start", "code": <source>, "port": <int>}
+    {"op": "stop", "port": <int>}
+
+and every request is answered with a single line on stdout:
+
+    READY <port> | STOPPED <port> | ERROR <port> <message>
+
+Flask and werkzeug are imported once at runner start-up. Each app is
+exec'd under a non-``__main__`` name with Flask.run made inert (so neither
+a guarded nor a bare app.run() blocks) and served by werkzeug's
+make_server on a daemon thread.
+"""
+
+import pickle
+import sys
+import threading
+from contextlib import contextmanager
+
+_servers = {}
+
+# While serve() execs user code, Flask.run is swapped for a wrapper that is a
+# no-op on the exec'ing thread, so a bare module-level app.run() (no
+# __main__ guard) cannot block; serve() then serves the app itself. Other
+# threads' app.run() calls pass straight through. Refcounted so concurrent
+# serve() calls share one install and the original is restored afterwards.
+_inert = threading.local()
+_run_guard_lock = threading.Lock()
+_run_guard_depth = 0
+_real_flask_run = None
+
+
+@contextmanager
+def _app_run_inert():
+    global _run_guard_depth, _real_flask_run
+    try:
+        from flask import Flask
+    except ImportError:
+        yield
+        return
+
+    with _run_guard_lock:
+        if _run_guard_depth == 0:
+            real_run = _real_flask_run = Flask.run
+
+            def run(self, *args, **kwargs):
+                if getattr(_inert, "active", False):
+                    return None
+                return real_run(self, *args, **kwargs)
+
+            Flask.run = run
+        _run_guard_depth += 1
+    _inert.active = True
+    try:
+        yield
+    finally:
+        _inert.active = False
+        with _run_guard_lock:
+            _run_guard_depth -= 1
+            if _run_guard_depth == 0:
+                Flask.run = _real_flask_run
+                _real_flask_run = None
+
+
+def _reply(line: str):
+    sys.stdout.write(line + "\n")
+    sys.stdout.flush()
+
+
+def _find_app(exec_globals):
+    app = exec_globals.get("app")
+    if app is not None:
+        return app
+    from flask import Flask
+
+    for val in exec_globals.values():
+        if isinstance(val, Flask):
+            return val
+    return None
+
+
+def serve(code: str, port: int, run_name: str = "__omnipkg_run__", fd=None):
+    """exec code, bind its app on 127.0.0.1:port and serve it on a daemon thread.
+
+    With fd, werkzeug serves on that already bound and listening socket
+    (it dups the descriptor) instead of binding the port itself.
+    Returns (server, thread). Also used directly by FlaskAppManager for
+    in-process serving.
+    """
+    from werkzeug.serving import make_server
+
+    exec_globals = {"__name__": run_name}
+    with _app_run_inert():
+        exec(code, exec_globals)
+    app = _find_app(exec_globals)
+    if app is None:
+        raise RuntimeError("No Flask app found")
+    # make_server binds in its constructor, so returning means connectable.
+    server = make_server("127.0.0.1", port, app, threaded=True, fd=fd)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, thread
+
+
+def stop(server, thread):
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=2.0)
+
+
+def _stop(port: int):
+    entry = _servers.pop(port, None)
+    if entry is not None:
+        stop(*entry)
+
+
+def _preload():
+    """Import Flask and the werkzeug server up front, before the first
+    request, so every app this runner serves skips that cost."""
+    for name in ("flask", "werkzeug.serving"):
+        try:
+            __import__(name)
+        except ImportError:
+            pass
+
+
+def main():
+    _preload()
+    stdin = sys.stdin.buffer
+    while True:
+        try:
+            msg = pickle.load(stdin)
+        except (EOFError, pickle.UnpicklingError):
+            break
+        port = msg.get("port")
+        try:
+            if msg.get("op") == "start":
+                _servers[port] = serve(msg["code"], port)
+                _reply(f"READY {port}")
+            elif msg.get("op") == "stop":
+                _stop(port)
+                _reply(f"STOPPED {port}")
+            else:
+                _reply(f"ERROR {port} unknown op {msg.get('op')!r}")
+        except BaseException as e:
+            _reply(f"ERROR {port} {type(e).__name__}: {e}".replace("\n", " "))
+
+    for port in list(_servers):
+        _stop(port)
+
+
+if __name__ == "__main__":
+    main()
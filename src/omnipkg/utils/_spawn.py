@@ -0,0 +1,140 @@
+"""
+Minimal subprocess.Popen look-alike around os.posix_spawn.
+
+posix_spawn goes through vfork/clone in glibc, so a spawn doesn't pay the
+fork() page-table copy of a large parent, and it takes one short
+file-actions list instead of Popen's option handling and error pipe.
+Callers check HAS_SPAWN and fall back to subprocess.Popen where it is
+missing (Windows).
+
+Stdio follows Popen: stdin is /dev/null unless stdin_pipe is set (then
+.stdin is a writable binary file); stdout_fd / stderr_fd are inherited
+when None, redirected to /dev/null for subprocess.DEVNULL, or dup2'd from
+the given descriptor otherwise.
+"""
+
+import os
+import select
+import shutil
+import signal
+import subprocess
+import time
+
+HAS_SPAWN = hasattr(os, "posix_spawn") and hasattr(os, "waitstatus_to_exitcode")
+
+
+def _stdio_action(fd, child_fd: int, actions: list):
+    if fd is None:
+        return
+    if fd == subprocess.DEVNULL:
+        actions.append((os.POSIX_SPAWN_OPEN, child_fd, os.devnull, os.O_WRONLY, 0))
+    else:
+        actions.append((os.POSIX_SPAWN_DUP2, fd, child_fd))
+
+
+class SpawnedProcess:
+    """poll/wait/send_signal/terminate/kill with Popen semantics."""
+
+    def __init__(
+        self,
+        argv: list,
+        env: dict,
+        stdin_pipe: bool = False,
+        stdout_fd: int = None,
+        stderr_fd: int = None,
+        pass_fds: dict = None,
+    ):
+        """
+        pass_fds maps child fd numbers to parent descriptors to dup2 onto
+        them (e.g. {3: ready_w}); everything else stays close-on-exec.
+        """
+        # Resolve against the child's PATH, as subprocess does
+        exe = shutil.which(argv[0], path=env.get("PATH"))
+        if exe is None:
+            raise FileNotFoundError(f"No such file or directory: {argv[0]!r}")
+
+        stdin_r = stdin_w = -1
+        moved = []
+        if stdin_pipe:
+            stdin_r, stdin_w = os.pipe()
+            actions = [(os.POSIX_SPAWN_DUP2, stdin_r, 0)]
+        else:
+            actions = [(os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0)]
+        _stdio_action(stdout_fd, 1, actions)
+        _stdio_action(stderr_fd, 2, actions)
+        for child_fd, parent_fd in (pass_fds or {}).items():
+            if parent_fd == child_fd:
+                # dup2 onto itself would not clear close-on-exec.
+                parent_fd = os.dup(parent_fd)
+                moved.append(parent_fd)
+            actions.append((os.POSIX_SPAWN_DUP2, parent_fd, child_fd))
+
+        try:
+            self.pid = os.posix_spawn(exe, argv, env, file_actions=actions)
+        except BaseException:
+            if stdin_w >= 0:
+                os.close(stdin_w)
+            raise
+        finally:
+            if stdin_r >= 0:
+                os.close(stdin_r)
+            for fd in moved:
+                os.close(fd)
+
+        self.args = argv
+        self.stdin = os.fdopen(stdin_w, "wb") if stdin_pipe else None
+        self.returncode = None
+        # pidfd lets wait(timeout) block on the kernel instead of polling
+        try:
+            self._pidfd = os.pidfd_open(self.pid)
+        except (AttributeError, OSError):
+            self._pidfd = None
+
+    def _reap(self, status: int):
+        self.returncode = os.waitstatus_to_exitcode(status)
+        if self._pidfd is not None:
+            os.close(self._pidfd)
+            self._pidfd = None
+
+    def poll(self):
+        if self.returncode is None:
+            pid, status = os.waitpid(self.pid, os.WNOHANG)
+            if pid:
+                self._reap(status)
+        return self.returncode
+
+    def wait(self, timeout: float = None):
+        """Like Popen.wait: raises subprocess.TimeoutExpired on timeout."""
+        if self.returncode is not None:
+            return self.returncode
+        if timeout is not None:
+            if self._pidfd is not None:
+                ready, unused_w, unused_x = select.select([self._pidfd], [], [], timeout)
+                if not ready:
+                    raise subprocess.TimeoutExpired(self.args, timeout)
+            else:
+                deadline = time.monotonic() + timeout
+                delay = 0.001
+                while self.poll() is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise subprocess.TimeoutExpired(self.args, timeout)
+                    time.sleep(min(delay, remaining))
+                    delay = min(delay * 2, 0.05)
+                return self.returncode
+        unused, status = os.waitpid(self.pid, 0)
+        self._reap(status)
+        return self.returncode
+
+    def send_signal(self, sig):
+        if self.poll() is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
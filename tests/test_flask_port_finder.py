@@ -8,9 +8,9 @@ Specifically stress-tests every known Windows failure mode:
   - UTF-8 / encoding issues (emoji, non-ASCII in generated code)
   - Path separators in generated subprocess code (backslash hell)
   - tempfile path with spaces / Unicode on Windows
-  - shutdown_file path embedded as a raw string in generated code
+  - signal-only shutdown of the isolated process (no shutdown file)
   - signal.SIGBREAK availability (Windows-only)
-  - NamedTemporaryFile(delete=False) + manual unlink (Windows file locking)
+  - wrapper piped over stdin, no NamedTemporaryFile (Windows file locking)
   - subprocess text=True encoding on Windows (cp1252 vs utf-8)
   - Port exhaustion / SO_REUSEADDR behaviour differences
   - Concurrent allocation race conditions
@@ -175,6 +175,29 @@ class TestPortReservation:
             f"Duplicate ports allocated: {sorted(allocated)}\n{_platform_info()}"
         )
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="shared port table needs fcntl")
+    def test_reservation_is_visible_to_another_process(self, fpf):
+        """A second interpreter must not be able to reserve a port we hold."""
+        port = fpf.find_free_port(start_port=17400, max_attempts=50, reserve=False)
+        assert fpf.reserve_port(port, duration=30.0)
+        src_root = Path(fpf.__file__).resolve().parents[2]
+        child = (
+            "import sys\n"
+            f"sys.path.insert(0, {str(src_root)!r})\n"
+            "from omnipkg.utils import flask_port_finder as f\n"
+            f"print(f.reserve_port({port}, duration=1.0))\n"
+        )
+        try:
+            result = subprocess.run(
+                [sys.executable, "-c", child], capture_output=True, text=True, timeout=30
+            )
+            assert result.returncode == 0, _subprocess_debug(result)
+            assert result.stdout.strip() == "False", (
+                f"Child process re-reserved port {port}" + _subprocess_debug(result)
+            )
+        finally:
+            fpf.release_port(port)
+
     def test_concurrent_allocation_via_threadpool(self, fpf):
         """ThreadPoolExecutor version — mimics the original built-in test."""
         def allocate(i):
@@ -221,6 +244,36 @@ class TestIsPortActuallyFree:
         finally:
             sock.close()
 
+    def test_busy_result_is_cached_only_briefly(self, fpf):
+        """A busy verdict is reused for _PROBE_TTL, then the port is re-probed."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        assert not fpf.is_port_actually_free(port)
+        sock.close()
+        assert not fpf.is_port_actually_free(port), "busy verdict should be cached"
+        time.sleep(fpf._PROBE_TTL * 2)
+        assert fpf.is_port_actually_free(port), (
+            f"Port {port} still reported busy after the probe TTL\n{_platform_info()}"
+        )
+
+    def test_failed_probe_socket_is_reused(self, fpf):
+        """A busy probe keeps its unbound socket for the next probe; a free one drops it."""
+        holder = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        holder.bind(("127.0.0.1", 0))
+        busy = holder.getsockname()[1]
+        try:
+            assert not fpf._probe_bind(busy)
+            spare = fpf._probe_tls.sock
+            assert spare is not None, "Busy probe should keep its socket"
+            assert not fpf._probe_bind(busy)
+            assert fpf._probe_tls.sock is spare, "Spare socket was not reused"
+        finally:
+            holder.close()
+        assert fpf._probe_bind(busy)
+        assert fpf._probe_tls.sock is None
+        assert spare.fileno() == -1, "Socket used by a successful bind must be closed"
+
     def test_never_raises_on_invalid_port(self, fpf):
         """is_port_actually_free must never raise — it should return False."""
         result = fpf.is_port_actually_free(0)
@@ -258,6 +311,66 @@ class TestFindFreePort:
             for p in ports_to_reserve:
                 fpf._reserved_ports.discard(p)
 
+    def test_cached_ports_are_distinct_and_reserved(self, fpf):
+        """Ports served from the per-thread batch cache are still unique and reserved."""
+        ports = [fpf.find_free_port(start_port=17200, max_attempts=50, reserve=True)
+                 for _ in range(fpf._TLS_BATCH + 2)]
+        try:
+            assert len(ports) == len(set(ports)), f"Duplicate cached ports: {ports}"
+            for p in ports:
+                assert p in fpf._reserved_ports, f"Port {p} handed out unreserved"
+        finally:
+            for p in ports:
+                fpf.release_port(p)
+
+    def test_ephemeral_port_is_free_and_reserved(self, fpf):
+        p = fpf.find_free_port(prefer_ephemeral=True)
+        try:
+            assert p in fpf._reserved_ports, f"Ephemeral port {p} handed out unreserved"
+            assert fpf.is_port_actually_free(p), f"Ephemeral port {p} is not bindable"
+        finally:
+            fpf.release_port(p)
+
+    def test_batch_allocation_reserves_distinct_ports(self, fpf):
+        ports = fpf.find_free_ports(10, start_port=17500, max_attempts=100)
+        try:
+            assert len(ports) == len(set(ports)) == 10, f"Bad batch: {ports}"
+            for p in ports:
+                assert p in fpf._reserved_ports, f"Port {p} handed out unreserved"
+        finally:
+            for p in ports:
+                fpf.release_port(p)
+
+    def test_batch_allocation_fails_whole_when_range_too_small(self, fpf):
+        with pytest.raises(RuntimeError, match="Could not find 5 free ports"):
+            fpf.find_free_ports(5, start_port=17600, max_attempts=3)
+        for p in range(17600, 17603):
+            assert p not in fpf._reserved_ports, "Partial batch should be released"
+
+    def test_reserving_scans_resume_past_last_port(self, fpf):
+        """A fresh reserving scan starts after the ports earlier scans handed out."""
+        fpf._tls.cache = []
+        first = fpf.find_free_port(start_port=17300, max_attempts=50, reserve=True)
+        batch = [first] + [p for p, _ in fpf._tls.cache]
+        fpf._tls.cache = []
+        try:
+            second = fpf.find_free_port(start_port=17300, max_attempts=50, reserve=True)
+            batch += [second] + [p for p, _ in fpf._tls.cache]
+            assert second > max(batch[:fpf._TLS_BATCH]), f"Scan restarted at the base: {batch}"
+        finally:
+            fpf._tls.cache = []
+            for p in batch:
+                fpf.release_port(p)
+
+    def test_xdist_workers_get_disjoint_default_ranges(self, fpf, monkeypatch):
+        bases = []
+        for worker in ("gw0", "gw1", "gw3"):
+            monkeypatch.setenv("PYTEST_XDIST_WORKER", worker)
+            bases.append(fpf._worker_port_base(1000))
+        assert bases == [5000, 6000, 8000], f"Unexpected worker bases: {bases}"
+        monkeypatch.delenv("PYTEST_XDIST_WORKER")
+        assert fpf._worker_port_base(1000) == 5000
+
     def test_no_reserve_does_not_add_to_reserved_set(self, fpf):
         before = set(fpf._reserved_ports)
         fpf.find_free_port(reserve=False)
@@ -312,6 +425,15 @@ class TestPatchFlaskCode:
         assert patched == code
         fpf.release_port(port)
 
+    def test_repeat_patch_reuses_template(self, fpf):
+        """Re-patching the same source reuses the cached template with the new port."""
+        fpf.patch_flask_code(SIMPLE_FLASK_APP, port=18301)
+        hits = fpf._patch_template.cache_info().hits
+        patched, port, unused = fpf.patch_flask_code(SIMPLE_FLASK_APP, port=18302)
+        assert fpf._patch_template.cache_info().hits == hits + 1
+        assert "port=18302" in patched and "port=18301" not in patched
+        assert fpf._PORT_PLACEHOLDER not in patched
+
     def test_port_is_unique_per_call(self, fpf):
         unused, p1, unused = fpf.patch_flask_code(SIMPLE_FLASK_APP)
         unused, p2, unused = fpf.patch_flask_code(SIMPLE_FLASK_APP)
@@ -396,6 +518,16 @@ class TestValidateFlaskAppSubprocess:
         fpf.release_port(port)
         assert result is False, "Syntactically broken app should fail validation"
 
+    def test_batch_validation_one_result_per_snippet(self, fpf):
+        """validate_flask_apps() checks every snippet in one child and keeps their order."""
+        pytest.importorskip("flask", reason="flask not installed")
+        results = fpf.validate_flask_apps(
+            [self.VALID_APP, self.INVALID_APP, self.VALID_APP], timeout=15.0
+        )
+        assert results == [True, False, True], (
+            f"Unexpected batch results {results}\n{_platform_info()}"
+        )
+
     @pytest.mark.windows_compat
     def test_large_stdout_does_not_deadlock(self, fpf):
         """
@@ -445,89 +577,60 @@ class TestValidateFlaskAppSubprocess:
     @pytest.mark.windows_compat
     def test_subprocess_encoding_flag_present(self, fpf):
         """
-        Verify that the subprocess.run() call in validate_flask_app uses
+        Verify that the subprocess.run() call in validate_flask_apps uses
         encoding or text=True so Windows doesn't get raw bytes.
         Inspects the source rather than running — fast and reliable.
         """
         import inspect
-        src = inspect.getsource(fpf.validate_flask_app)
+        src = inspect.getsource(fpf.validate_flask_apps)
         has_text = "text=True" in src
         has_encoding = "encoding=" in src
         assert has_text or has_encoding, (
-            "validate_flask_app subprocess.run() has neither text=True nor encoding= !\n"
+            "validate_flask_apps subprocess.run() has neither text=True nor encoding= !\n"
             "On Windows cp1252 this will fail on any non-ASCII output.\n"
             f"Source snippet:\n{src[:600]}"
         )
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# CONTRACT 7 — shutdown_file path safety on Windows
+# CONTRACT 7 — shutdown is signal-only (no shutdown file on disk)
 # ─────────────────────────────────────────────────────────────────────────────
 
-class TestShutdownFilePath:
+class TestSignalOnlyShutdown:
     """
-    The shutdown file path is embedded as a raw string inside generated Python
-    source (the wrapper_code f-string in FlaskAppManager.start()).
-    On Windows, tempdir is often C:\\Users\\... which breaks Python string literals.
+    FlaskAppManager stops an isolated process with SIGTERM (CTRL_BREAK_EVENT
+    on Windows). There is no flask_shutdown_<port>.signal file to embed in
+    generated source, poll, or clean up.
     """
 
     @pytest.mark.windows_compat
-    def test_shutdown_file_path_is_safe_in_generated_source(self, fpf):
-        """
-        The shutdown file path embedded in wrapper_code must be either:
-          - Forward-slash only, OR
-          - Properly escaped (double backslashes), OR
-          - A raw string literal
-        We check by attempting to compile the generated source snippet.
-        """
+    def test_no_shutdown_file_in_generated_source(self, fpf):
         import inspect
-        port = fpf.find_free_port(reserve=True)
-        manager = fpf.FlaskAppManager(SIMPLE_FLASK_APP, port, validate_only=False)
-        fpf.release_port(port)
-
-        # Reproduce the wrapper_code path embed as the real code does
-        shutdown_path = str(manager.shutdown_file)
-
-        # If the path has backslashes (Windows), they'd appear raw in f-string
-        # which is a SyntaxError or wrong path.
-        if "\\" in shutdown_path:
-            safe_path = shutdown_path.replace("\\", "\\\\")
-            # Verify the safe version compiles
-            snippet = f'shutdown_file = Path("{safe_path}")\n'
-            try:
-                compile(snippet, "<test>", "exec")
-            except SyntaxError as e:
-                pytest.fail(
-                    f"Shutdown file path breaks Python source generation on Windows!\n"
-                    f"Raw path: {shutdown_path!r}\n"
-                    f"Snippet: {snippet!r}\n"
-                    f"Error: {e}\n{_platform_info()}"
-                )
+        src = inspect.getsource(fpf.FlaskAppManager.start)
+        assert "shutdown_file" not in src and "flask_shutdown_" not in src, (
+            f"start() still references a shutdown signal file\nSource:\n{src}"
+        )
 
-    @pytest.mark.windows_compat
-    def test_shutdown_file_created_in_temp_dir(self, fpf):
+    def test_shutdown_writes_no_signal_file(self, fpf):
         port = fpf.find_free_port(reserve=True)
-        manager = fpf.FlaskAppManager(SIMPLE_FLASK_APP, port, validate_only=False)
-        fpf.release_port(port)
-        # Must be in a temp directory — critical for cross-user isolation on Windows
-        temp_dir = Path(tempfile.gettempdir()).resolve()
-        assert str(manager.shutdown_file).startswith(str(temp_dir)), (
-            f"shutdown_file not in tempdir!\n"
-            f"  shutdown_file : {manager.shutdown_file}\n"
-            f"  tempdir       : {temp_dir}"
-        )
+        manager = fpf.FlaskAppManager(SIMPLE_FLASK_APP, port, validate_only=True)
+        with patch.object(fpf, "validate_flask_app", return_value=True):
+            manager.start()
+        manager.shutdown()
+        signal_file = Path(tempfile.gettempdir()) / f"flask_shutdown_{port}.signal"
+        assert not signal_file.exists(), f"Unexpected shutdown file: {signal_file}"
 
-    @pytest.mark.windows_compat
-    def test_shutdown_file_name_no_special_chars(self, fpf):
-        """Shutdown file name must be safe on Windows (no colons, no pipes, etc.)."""
+    def test_isolated_process_stops_on_signal(self, fpf):
+        """A process-mode child exits from shutdown()'s signal, not the kill fallback."""
         port = fpf.find_free_port(reserve=True)
-        manager = fpf.FlaskAppManager(SIMPLE_FLASK_APP, port)
-        fpf.release_port(port)
-        name = manager.shutdown_file.name
-        forbidden = set(':*?"<>|')
-        bad = forbidden & set(name)
-        assert not bad, (
-            f"Shutdown file name {name!r} contains Windows-forbidden chars: {bad}"
+        manager = fpf.FlaskAppManager("import time\ntime.sleep(60)\n", port, isolation="process")
+        assert manager.start()
+        time.sleep(0.5)  # let the wrapper install its handler
+        started = time.monotonic()
+        manager.shutdown()
+        assert manager.process.poll() is not None, "child still running after shutdown()"
+        assert time.monotonic() - started < 3.0, (
+            f"shutdown() fell through to terminate/kill\n{_platform_info()}"
         )
 
 
@@ -543,12 +646,14 @@ class TestTempFileHandling:
     """
 
     @pytest.mark.windows_compat
-    def test_tempfile_uses_delete_false(self, fpf):
+    def test_process_wrapper_is_piped_not_written(self, fpf):
+        """The dedicated-process path feeds its wrapper over stdin, so there is
+        no temp file for Windows to lock in the first place."""
         import inspect
         src = inspect.getsource(fpf.FlaskAppManager.start)
-        assert "delete=False" in src, (
-            "FlaskAppManager.start() does not use delete=False for NamedTemporaryFile!\n"
-            "On Windows, delete=True prevents the subprocess from opening the file.\n"
+        assert "NamedTemporaryFile" not in src and "stdin=subprocess.PIPE" in src, (
+            "FlaskAppManager.start() should pipe the wrapper to a -c loader "
+            "instead of writing a temp file.\n"
             f"Source:\n{src}"
         )
 
@@ -654,18 +759,65 @@ class TestFlaskAppManagerLifecycle:
         manager.shutdown()
         manager.shutdown()  # must not raise
 
-    def test_shutdown_file_cleaned_up(self, fpf):
+    def test_wait_for_all_ready_polls_every_port(self, fpf):
+        listeners = []
+        for _i in range(3):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.bind(("127.0.0.1", 0))
+            sock.listen(8)
+            listeners.append(sock)
+        managers = [fpf.FlaskAppManager(SIMPLE_FLASK_APP, s.getsockname()[1]) for s in listeners]
+        try:
+            assert fpf.wait_for_all_ready(managers, timeout=5.0)
+        finally:
+            for sock in listeners:
+                sock.close()
+
+    def test_wait_for_all_ready_times_out_on_silent_port(self, fpf):
         port = fpf.find_free_port(reserve=True)
-        manager = fpf.FlaskAppManager(SIMPLE_FLASK_APP, port, validate_only=True)
-        with patch.object(fpf, "validate_flask_app", return_value=True):
-            manager.start()
-        # Create the signal file as the real shutdown would
-        manager.shutdown_file.parent.mkdir(parents=True, exist_ok=True)
-        manager.shutdown_file.write_text("SHUTDOWN")
+        manager = fpf.FlaskAppManager(SIMPLE_FLASK_APP, port)
+        start = time.monotonic()
+        try:
+            assert not fpf.wait_for_all_ready([manager], timeout=0.3)
+        finally:
+            fpf.release_port(port)
+        assert time.monotonic() - start < 2.0
+
+    def test_only_running_managers_are_registered_for_exit(self, fpf):
+        """One module-level atexit hook covers running managers; idle ones aren't pinned."""
+        port = fpf.find_free_port(reserve=True)
+        manager = fpf.FlaskAppManager("import time\ntime.sleep(60)\n", port, isolation="process")
+        assert manager not in fpf._live_managers
+        assert manager.start()
+        assert manager in fpf._live_managers
         manager.shutdown()
-        assert not manager.shutdown_file.exists(), (
-            f"Shutdown signal file not cleaned up: {manager.shutdown_file}"
-        )
+        assert manager not in fpf._live_managers
+
+    def test_crashed_process_ends_wait_promptly(self, fpf):
+        """A dead child closes its READY pipe, so wait_for_ready returns long before timeout."""
+        port = fpf.find_free_port(reserve=True)
+        manager = fpf.FlaskAppManager("raise SystemExit(3)\n", port, isolation="process")
+        try:
+            assert manager.start()
+            started = time.monotonic()
+            assert manager.wait_for_ready(timeout=10.0) is False
+            assert time.monotonic() - started < 5.0, "wait_for_ready ran to its timeout"
+        finally:
+            manager.shutdown()
+
+    def test_isolated_process_stderr_is_kept(self, fpf):
+        """A crashing process-mode child leaves its traceback in stderr_tail()."""
+        port = fpf.find_free_port(reserve=True)
+        code = "import sys\nprint('x' * 200000, file=sys.stderr)\nraise RuntimeError('boom-marker')\n"
+        manager = fpf.FlaskAppManager(code, port, isolation="process")
+        try:
+            assert manager.start()
+            assert manager.wait_for_ready(timeout=5.0) is False
+            tail = manager.stderr_tail()
+            assert "boom-marker" in tail, f"traceback missing from stderr tail: {tail[-300:]!r}"
+            assert len(tail) <= fpf._STDERR_TAIL_CHUNKS * 4096, "stderr tail is not bounded"
+        finally:
+            manager.shutdown()
 
     @pytest.mark.windows_compat
     def test_manager_port_is_int(self, fpf):
@@ -720,17 +872,17 @@ class TestSubprocessEncoding:
     @pytest.mark.windows_compat
     def test_validation_subprocess_env_has_utf8(self, fpf):
         """
-        Verify that validate_flask_app() either passes encoding='utf-8' or
+        Verify that validate_flask_apps() either passes encoding='utf-8' or
         sets PYTHONIOENCODING=utf-8 in the child's environment.
         """
         import inspect
-        src = inspect.getsource(fpf.validate_flask_app)
+        src = inspect.getsource(fpf.validate_flask_apps)
         has_encoding_kwarg = "encoding='utf-8'" in src or 'encoding="utf-8"' in src
         has_pythonioencoding = "PYTHONIOENCODING" in src
         has_text = "text=True" in src  # text=True uses default encoding — acceptable if env fixed
 
         assert has_encoding_kwarg or has_pythonioencoding or has_text, (
-            "validate_flask_app subprocess has no UTF-8 encoding protection!\n"
+            "validate_flask_apps subprocess has no UTF-8 encoding protection!\n"
             "On Windows cp1252, any non-ASCII output will corrupt or crash.\n"
             "Fix: add encoding='utf-8' to subprocess.run() OR set "
             "env['PYTHONIOENCODING'] = 'utf-8'\n"
@@ -738,17 +890,18 @@ class TestSubprocessEncoding:
         )
 
     @pytest.mark.windows_compat
-    def test_validate_subprocess_env_is_copy_not_mutated(self, fpf):
+    def test_validate_subprocess_env_is_not_mutated(self, fpf):
         """
-        validate_flask_app() must not mutate os.environ directly.
-        It should pass env=os.environ.copy() to subprocess.run().
+        validate_flask_apps() must not mutate os.environ directly. It gets
+        UTF-8 stdio from `-X utf8` and lets the child inherit the environment.
         """
         import inspect
-        src = inspect.getsource(fpf.validate_flask_app)
-        assert "os.environ.copy()" in src or "env=" in src, (
-            "validate_flask_app does not pass env= to subprocess.run().\n"
+        src = inspect.getsource(fpf.validate_flask_apps)
+        assert "os.environ[" not in src and "os.environ.update" not in src, (
+            "validate_flask_apps mutates os.environ.\n"
             "This can cause PYTHONIOENCODING mutation to leak into the parent process."
         )
+        assert '"-X", "utf8"' in src, "validate_flask_apps child is not started in UTF-8 mode"
 
     def test_actual_utf8_roundtrip(self, fpf):
         """
@@ -804,27 +957,6 @@ class TestTempfilePathEdgeCases:
             )
             assert "space test ok" in result.stdout
 
-    @pytest.mark.windows_compat
-    def test_shutdown_file_path_with_spaces_survives_fstring(self, fpf):
-        """
-        Simulate the shutdown_file being in a path with spaces and verify
-        the generated wrapper_code Path() call is syntactically valid.
-        """
-        fake_path = Path(tempfile.gettempdir()) / "path with spaces" / "flask_shutdown_9999.signal"
-        path_str = str(fake_path)
-
-        # This is exactly how wrapper_code embeds the path:
-        snippet = f'from pathlib import Path\nshutdown_file = Path(r"{path_str}")\n'
-        try:
-            compile(snippet, "<test>", "exec")
-        except SyntaxError as e:
-            pytest.fail(
-                f"Path with spaces breaks generated source!\n"
-                f"Path: {path_str!r}\n"
-                f"Snippet: {snippet!r}\n"
-                f"SyntaxError: {e}"
-            )
-
 
 # ─────────────────────────────────────────────────────────────────────────────
 # CONTRACT 14 — SLOW: Real Flask server lifecycle (requires flask installed)
@@ -875,6 +1007,61 @@ class TestRealFlaskLifecycle:
             f"Port {port} still occupied after shutdown\n{_platform_info()}"
         )
 
+    def test_process_isolation_serves_app(self, fpf):
+        port = fpf.find_free_port(start_port=18200, max_attempts=100, reserve=True)
+        patched, port, _unused = fpf.patch_flask_code(SIMPLE_FLASK_APP, port=port)
+        manager = fpf.FlaskAppManager(patched, port, isolation="process")
+
+        assert manager.start(), f"isolation='process' start failed\n{_platform_info()}"
+        try:
+            assert manager.wait_for_ready(timeout=15.0), (
+                f"Flask subprocess never became ready on port {port}\n{_platform_info()}"
+            )
+            import urllib.request
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=5) as resp:
+                assert "Hello" in resp.read().decode("utf-8")
+        finally:
+            manager.shutdown()
+
+    def test_held_socket_is_served_without_rebinding(self, fpf):
+        port, sock = fpf.bind_free_port(start_port=18300, max_attempts=100)
+        patched, port, _unused = fpf.patch_flask_code(SIMPLE_FLASK_APP, port=port)
+        manager = fpf.FlaskAppManager(patched, port, sock=sock)
+
+        assert manager.start(), f"start() with a held socket failed\n{_platform_info()}"
+        try:
+            assert sock.fileno() == -1, "Manager should close its copy of the socket"
+            import urllib.request
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=5) as resp:
+                assert "Hello" in resp.read().decode("utf-8")
+        finally:
+            manager.shutdown()
+
+    def test_unguarded_app_run_does_not_block_thread_mode(self, fpf):
+        code = (
+            "from flask import Flask\n"
+            "app = Flask(__name__)\n"
+            "@app.route('/')\n"
+            "def home():\n"
+            "    return 'Hello unguarded'\n"
+            "app.run()\n"
+        )
+        patched, port, manager = fpf.patch_flask_code(code, interactive=True)
+        assert manager.isolation == "thread"
+
+        started = []
+        starter = threading.Thread(target=lambda: started.append(manager.start()), daemon=True)
+        starter.start()
+        starter.join(timeout=8.0)
+        try:
+            assert not starter.is_alive(), "start() blocked on a bare app.run()"
+            assert started == [True]
+            import urllib.request
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=5) as resp:
+                assert "Hello unguarded" in resp.read().decode("utf-8")
+        finally:
+            manager.shutdown()
+
     @pytest.mark.windows_compat
     def test_flask_validation_succeeds_on_valid_app(self, fpf):
         port = fpf.find_free_port(reserve=True)
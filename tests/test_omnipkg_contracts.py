@@ -386,6 +386,25 @@ class TestThreadSafety:
 
         assert not errors, "Thread safety violations:\n" + "\n".join(errors)
 
+    @pytest.mark.fast
+    @pytest.mark.daemon
+    def test_async_smart_calls_resolve_to_their_own_version(self, daemon_client):
+        """
+        execute_smart_async() fired at several versions before any is
+        gathered must resolve each Future to its own version's output.
+        """
+        VERSIONS = ["1.24.3", "1.26.4", "2.3.5"]
+        code = "import numpy as np; print(np.__version__)"
+
+        futs = [
+            (ver, daemon_client.execute_smart_async(f"numpy=={ver}", code))
+            for ver in VERSIONS
+        ]
+        for ver, fut in futs:
+            res = fut.result(timeout=120)
+            assert res.get("success"), f"numpy=={ver}: {res.get('error')}"
+            assert res["result"].splitlines()[-1] == ver
+
     @pytest.mark.slow
     @pytest.mark.daemon
     def test_high_frequency_same_worker(self, daemon_client):
@@ -1036,4 +1055,87 @@ class TestDaemonLifecycle:
         _assert_exec_ok(good, context="post-exception recovery")
         assert good["stdout"].strip() == "1.26.4", (
             "Worker returned wrong version after recovering from exception"
-        )
\ No newline at end of file
+        )
+
+# ─────────────────────────────────────────────────────────────────────────────
+# CONTRACT 11: Batched execution — linked chains in one round-trip
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestExecuteBatch:
+    """
+    execute_batch() must run steps of a chain in order, stop a chain at its
+    first failure, and keep independent chains independent.
+    """
+
+    @pytest.mark.fast
+    @pytest.mark.daemon
+    def test_chain_steps_run_in_order(self, daemon_client):
+        """Later steps in a chain must see state left by earlier ones."""
+        spec = "numpy==1.26.4"
+        tag = f"batch_order_{os.getpid()}"
+        res = daemon_client.execute_batch([[
+            {"spec": spec, "code": "globals()['_batch_seq'] = [1]", "worker_tag": tag},
+            {"spec": spec, "code": "_batch_seq.append(2)", "worker_tag": tag},
+            {"spec": spec, "code": "print(_batch_seq)", "worker_tag": tag},
+        ]])
+        assert res.get("success"), f"execute_batch failed: {res}"
+        steps = res["results"][0]
+        assert steps[2]["stdout"].strip() == "[1, 2]"
+        assert all("elapsed_ms" in s for s in steps)
+
+    @pytest.mark.fast
+    @pytest.mark.daemon
+    def test_failed_step_cancels_rest_of_chain_only(self, daemon_client):
+        """A failure cancels the remainder of its own chain, not other chains."""
+        spec = "numpy==1.26.4"
+        res = daemon_client.execute_batch([
+            [
+                {"spec": spec, "code": "raise ValueError('linked failure')"},
+                {"spec": spec, "code": "print('must not run')"},
+            ],
+            [
+                {"spec": spec, "code": "print('independent')"},
+            ],
+        ])
+        assert not res.get("success")
+        failed_chain, ok_chain = res["results"]
+        assert not failed_chain[0]["success"]
+        assert failed_chain[1]["status"] == "CANCELED"
+        _assert_exec_ok(ok_chain[0], context="independent chain")
+        assert ok_chain[0]["stdout"].strip() == "independent"
+
+    @pytest.mark.fast
+    @pytest.mark.daemon
+    def test_zero_copy_batch_returns_one_result_per_input(self, daemon_client):
+        """execute_zero_copy_batch() must hand back each sub-request's own output."""
+        np = pytest.importorskip("numpy")
+        inputs = [np.full((4, 4), float(i)) for i in range(3)]
+        batch = daemon_client.execute_zero_copy_batch(
+            ["numpy==1.26.4"] * 3,
+            ["arr_out[0] = arr_in.sum()"] * 3,
+            inputs,
+            [(1,)] * 3,
+        )
+        assert [float(arr[0]) for arr, unused in batch] == [0.0, 16.0, 32.0]
+        assert all("elapsed_ms" in resp for unused, resp in batch)
+
+    @pytest.mark.fast
+    @pytest.mark.daemon
+    def test_reused_shm_buffers_carry_each_calls_data(self, daemon_client):
+        """Buffers from alloc_shm_buffer() survive calls and never leak stale input."""
+        np = pytest.importorskip("numpy")
+        buf_in = daemon_client.alloc_shm_buffer((4, 4), "float64")
+        buf_out = daemon_client.alloc_shm_buffer((1,), "float64")
+        try:
+            sums = []
+            for value in (1.0, 2.0):
+                result, unused = daemon_client.execute_zero_copy(
+                    "numpy==1.26.4", "arr_out[0] = arr_in.sum()",
+                    np.full((4, 4), value), (1,), "float64",
+                    input_buffer=buf_in, output_buffer=buf_out,
+                )
+                sums.append(float(result[0]))
+            assert sums == [16.0, 32.0]
+        finally:
+            buf_in.close()
+            buf_out.close()